@@ -0,0 +1,175 @@
+import math
+from array import array
+
+from angle_class import Angle, PI, TRIG_TABLE
+
+TWO_PI = 2 * PI
+
+
+class AngleArray:
+    """Массив углов в непрерывном буфере float64 (array('d')) для пакетных вычислений"""
+
+    def __init__(self, values=(), radians=None, degrees=None):
+        """
+        Создание массива углов. Можно задать:
+        - напрямую значения в радианах: AngleArray([0.5, 1.57])
+        - через именованные параметры: AngleArray(radians=[...]) или AngleArray(degrees=[90, 180])
+        Элементами могут быть Angle, int или float.
+        """
+        if radians is not None:
+            self._radians = array('d', map(self._to_radians, radians))
+        elif degrees is not None:
+            self._radians = array('d', (math.radians(float(v)) for v in degrees))
+        else:
+            self._radians = array('d', map(self._to_radians, values))
+        self._normal = None
+
+    @staticmethod
+    def _to_radians(value):
+        """Преобразование элемента в радианы"""
+        if isinstance(value, Angle):
+            return value.radians
+        elif isinstance(value, (int, float)):
+            return float(value)
+        else:
+            raise TypeError("Значение должно быть Angle, int или float")
+
+    @classmethod
+    def _from_buffer(cls, buffer):
+        """Создание массива поверх готового буфера без копирования"""
+        obj = cls.__new__(cls)
+        obj._radians = buffer
+        obj._normal = None
+        return obj
+
+    @classmethod
+    def from_angles(cls, angles):
+        """Создание массива из списка Angle"""
+        return cls._from_buffer(array('d', (a.radians for a in angles)))
+
+    def to_angles(self):
+        """Преобразование в список Angle"""
+        return [Angle(radians=v) for v in self._radians]
+
+    @property
+    def _normal_ang(self):
+        """Нормализованные значения в диапазоне [0, 2*pi), вычисляются один раз"""
+        if self._normal is None:
+            self._normal = array('d', (v % TWO_PI for v in self._radians))
+        return self._normal
+
+    @property
+    def radians(self):
+        return array('d', self._radians)
+
+    @property
+    def degrees(self):
+        return array('d', map(math.degrees, self._radians))
+
+    def normalized(self):
+        """Новый массив с углами, приведенными к [0, 2*pi)"""
+        return self._from_buffer(array('d', self._normal_ang))
+
+    def sin(self, table=False):
+        """Синусы всех углов; table=True - приближение по TRIG_TABLE (медленнее точного расчета)"""
+        return array('d', map(TRIG_TABLE.sin if table else math.sin, self._radians))
+
+    def cos(self, table=False):
+        """Косинусы всех углов; table=True - приближение по TRIG_TABLE (медленнее точного расчета)"""
+        return array('d', map(TRIG_TABLE.cos if table else math.cos, self._radians))
+
+    @classmethod
+    def atan2(cls, ys, xs):
+        """Массив углов по координатам точек"""
+        return cls._from_buffer(array('d', map(math.atan2, ys, xs)))
+
+    def __len__(self):
+        return len(self._radians)
+
+    def __iter__(self):
+        return iter(self.to_angles())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_buffer(self._radians[index])
+        return Angle(radians=self._radians[index])
+
+    def _operand(self, other):
+        """Второй операнд: массив такой же длины или скаляр"""
+        if isinstance(other, AngleArray):
+            if len(other) != len(self):
+                raise ValueError("Массивы углов должны быть одинаковой длины")
+            return other._radians, True
+        if isinstance(other, Angle):
+            return other.radians, False
+        if isinstance(other, (int, float)):
+            return float(other), False
+        return None, False
+
+    def _binary(self, other, op):
+        values, elementwise = self._operand(other)
+        if values is None:
+            return NotImplemented
+        if elementwise:
+            return self._from_buffer(array('d', map(op, self._radians, values)))
+        return self._from_buffer(array('d', (op(v, values) for v in self._radians)))
+
+    def __add__(self, other):
+        return self._binary(other, float.__add__)
+
+    def __sub__(self, other):
+        return self._binary(other, float.__sub__)
+
+    def __mul__(self, other):
+        if isinstance(other, (AngleArray, Angle)):
+            return NotImplemented
+        return self._binary(other, float.__mul__)
+
+    def __truediv__(self, other):
+        if isinstance(other, (AngleArray, Angle)):
+            return NotImplemented
+        return self._binary(other, float.__truediv__)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def _compare(self, other, op):
+        """Поэлементное сравнение нормализованных значений, результат - список bool"""
+        if isinstance(other, AngleArray):
+            if len(other) != len(self):
+                raise ValueError("Массивы углов должны быть одинаковой длины")
+            return list(map(op, self._normal_ang, other._normal_ang))
+        if isinstance(other, Angle):
+            value = other._normal_ang
+        elif isinstance(other, (int, float)):
+            value = float(other) % TWO_PI
+        else:
+            return NotImplemented
+        return [op(v, value) for v in self._normal_ang]
+
+    def __eq__(self, other):
+        '''поэлементное сравнение углов в радианах'''
+        return self._compare(other, lambda a, b: math.isclose(a, b, rel_tol=1e-9))
+
+    def __ne__(self, other):
+        return self._compare(other, lambda a, b: not math.isclose(a, b, rel_tol=1e-9))
+
+    def __lt__(self, other):
+        return self._compare(other, float.__lt__)
+
+    def __le__(self, other):
+        return self._compare(other, float.__le__)
+
+    def __gt__(self, other):
+        return self._compare(other, float.__gt__)
+
+    def __ge__(self, other):
+        return self._compare(other, float.__ge__)
+
+    __hash__ = None
+
+    def __str__(self):
+        return '[' + ', '.join(f'{v:.4f}' for v in self._radians) + ']'
+
+    def __repr__(self):
+        return f"AngleArray(radians={list(self._radians)})"
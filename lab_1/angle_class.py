@@ -1,11 +1,50 @@
 import math
+from array import array
 
 PI = math.pi
 
 
+class TrigTable:
+    """
+    Таблица sin/cos на равномерной сетке [0, 2*pi] с линейной интерполяцией.
+    Погрешность интерполяции не превышает step**2 / 8, где step = 2*pi / size
+    (для size = 4096 это около 3e-7).
+    В CPython таблица не быстрее math.sin/math.cos: поиск в ней написан на Python,
+    а math вызывает C-функцию. Точный расчет остается основным путем.
+    """
+
+    def __init__(self, size=4096):
+        self.size = size
+        self._scale = size / (2 * PI)
+        step = 2 * PI / size
+        self.max_error = step ** 2 / 8
+        self._sin = array('d', (math.sin(i * step) for i in range(size + 1)))
+        self._cos = array('d', (math.cos(i * step) for i in range(size + 1)))
+
+    def _lookup(self, table, x):
+        i = int(x)
+        if i >= self.size:
+            # для малых отрицательных углов radians % (2*pi) округляется ровно до 2*pi
+            x -= self.size
+            i = int(x)
+        left = table[i]
+        return left + (table[i + 1] - left) * (x - i)
+
+    def sin(self, radians):
+        return self._lookup(self._sin, (radians % (2 * PI)) * self._scale)
+
+    def cos(self, radians):
+        return self._lookup(self._cos, (radians % (2 * PI)) * self._scale)
+
+
+TRIG_TABLE = TrigTable()
+
+
 class Angle:
     """Класс для работы с углами"""
 
+    __slots__ = ('_radians',)
+
     def __init__(self, value=0.0, radians=None, degrees=None):
         """
         Создание угла. Можно задать:
@@ -93,6 +132,88 @@ class Angle:
     def __repr__(self):
         return f"Angle(radians={self._radians})"
 
+    def sin(self, table=False):
+        """Синус угла; table=True - приближение по TRIG_TABLE (не быстрее, погрешность до TRIG_TABLE.max_error)"""
+        if table:
+            return TRIG_TABLE.sin(self._radians)
+        return math.sin(self._radians)
+
+    def cos(self, table=False):
+        """Косинус угла; table=True - приближение по TRIG_TABLE"""
+        if table:
+            return TRIG_TABLE.cos(self._radians)
+        return math.cos(self._radians)
+
+    @classmethod
+    def atan2(cls, y, x):
+        """Угол по координатам точки (y, x)"""
+        return cls(radians=math.atan2(float(y), float(x)))
+
+
+class CompactAngle(Angle):
+    """
+    Угол с кэшированным нормализованным значением.
+    Нормализованное значение считается один раз и хранится в слоте _normal_ang,
+    который перекрывает одноименное свойство Angle, поэтому сравнения не делают
+    операцию % на каждом вызове. При frozen=True угол неизменяемый и хешируемый.
+    """
+
+    __slots__ = ('_normal_ang', '_frozen')
+
+    def __init__(self, value=0.0, radians=None, degrees=None, frozen=False):
+        object.__setattr__(self, '_frozen', False)
+        super().__init__(value, radians=radians, degrees=degrees)
+        object.__setattr__(self, '_frozen', frozen)
+
+    @classmethod
+    def from_angle(cls, angle, frozen=False):
+        """Создание из обычного Angle"""
+        return cls(radians=angle.radians, frozen=frozen)
+
+    @property
+    def frozen(self):
+        return self._frozen
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError("Неизменяемый угол нельзя изменить")
+        object.__setattr__(self, name, value)
+        if name == '_radians':
+            object.__setattr__(self, '_normal_ang', self._radians % (2 * PI))
+
+    def __eq__(self, other):
+        """
+        Два неизменяемых угла равны только при точном совпадении нормализованных значений,
+        иначе хеш расходился бы с равенством; остальные сравнения - как у Angle
+        """
+        if isinstance(other, CompactAngle) and self._frozen and other._frozen:
+            return self._normal_ang == other._normal_ang
+        return super().__eq__(other)
+
+    def __hash__(self):
+        """Хеш по точному нормализованному значению, только для неизменяемых углов"""
+        if not self._frozen:
+            raise TypeError("Изменяемый угол нельзя хешировать, используйте frozen=True")
+        return hash(self._normal_ang)
+
+    def __reduce__(self):
+        """Копирование и pickle через конструктор: __setattr__ не дает восстанавливать слоты по одному"""
+        return type(self), (self._radians, None, None, self._frozen)
+
+    def __repr__(self):
+        return f"CompactAngle(radians={self._radians}, frozen={self._frozen})"
+
+
+def normalize_radians(value):
+    """Угол (Angle, int или float) в радианах, приведенный к [0, 2*pi)"""
+    if isinstance(value, Angle):
+        radians = value._normal_ang
+    elif isinstance(value, (int, float)):
+        radians = float(value) % (2 * PI)
+    else:
+        raise TypeError("Значение должно быть Angle, int или float")
+    # для малых отрицательных углов остаток от деления округляется ровно до 2*pi
+    return 0.0 if radians == 2 * PI else radians
 
 
 class AngleRange:
@@ -206,6 +327,24 @@ class AngleRange:
         return (other.start in self or other.end in self or
                 self.start in other or self.end in other)
 
+    def _segments(self):
+        """
+        Разбиение промежутка на отрезки внутри [0, 2*pi].
+        Возвращает список кортежей (lo, hi, lo_inclusive, hi_inclusive):
+        один отрезок в нормальном случае и два, если промежуток пересекает 0.
+        """
+        start_rad = self.start._normal_ang
+        end_rad = self.end._normal_ang
+
+        if start_rad < end_rad:
+            return [(start_rad, end_rad, self.start_inclusive, self.end_inclusive)]
+        if start_rad == end_rad and self.start.radians == self.end.radians:
+            # Точка
+            return [(start_rad, end_rad, self.start_inclusive, self.end_inclusive)]
+        # Промежуток пересекает 0 (или делает полный оборот)
+        return [(start_rad, 2 * PI, self.start_inclusive, False),
+                (0.0, end_rad, True, self.end_inclusive)]
+
 # region angle test
 ang1 = Angle(1.5708)                # Значение в радианах (1.5708)
 ang2 = Angle(radians=PI / 2)        # Именованный параметр radians (pi/2)
@@ -0,0 +1,146 @@
+import csv
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+
+from angle_class import Angle, AngleRange
+from angle_array import AngleArray
+
+# Запись промежутка в бинарном файле: start, end (float64, little-endian) и два флага включения
+RANGE_RECORD = struct.Struct('<dd??')
+
+
+@contextmanager
+def _mapped(path):
+    """Файл, отображенный в память (пустой файл отобразить нельзя - отдаем b'')"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _radians_buffer(angles):
+    """Радианы из AngleArray (без копирования), списка Angle или чисел"""
+    if isinstance(angles, AngleArray):
+        return angles._radians
+    return array('d', (a.radians if isinstance(a, Angle) else float(a) for a in angles))
+
+
+# region Angles
+
+def iter_angles_csv(path, column=0, degrees=False, skip_header=False):
+    """Потоковое чтение значений углов (в радианах) из столбца CSV"""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        if skip_header:
+            next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            value = float(row[column])
+            yield math.radians(value) if degrees else value
+
+
+def read_angles_csv(path, column=0, degrees=False, skip_header=False, as_array=True):
+    """
+    Чтение углов из CSV.
+    as_array=True - AngleArray без создания объектов Angle, иначе список Angle
+    """
+    values = array('d', iter_angles_csv(path, column, degrees, skip_header))
+    angles = AngleArray._from_buffer(values)
+    return angles if as_array else angles.to_angles()
+
+
+def write_angles_csv(path, angles, degrees=False):
+    """Запись углов (Angle, AngleArray или числа в радианах) в CSV по одному в строке"""
+    values = _radians_buffer(angles)
+    if degrees:
+        values = map(math.degrees, values)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        f.writelines(f'{v!r}\n' for v in values)
+
+
+def read_angles_binary(path, as_array=True):
+    """
+    Чтение углов из файла упакованных float64 (little-endian, радианы).
+    Файл отображается в память и копируется в буфер одним вызовом.
+    """
+    values = array('d')
+    with _mapped(path) as data:
+        values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    angles = AngleArray._from_buffer(values)
+    return angles if as_array else angles.to_angles()
+
+
+def write_angles_binary(path, angles):
+    """Запись углов в файл упакованных float64 (little-endian, радианы)"""
+    values = _radians_buffer(angles)
+    if sys.byteorder == 'big':
+        values = array('d', values)
+        values.byteswap()
+    with open(path, 'wb') as f:
+        values.tofile(f)
+
+# endregion
+
+# region Ranges
+
+
+def iter_ranges_csv(path, degrees=False, skip_header=False):
+    """
+    Потоковое чтение промежутков из CSV.
+    Строка: start, end[, start_inclusive, end_inclusive] (флаги - 0/1)
+    """
+    convert = math.radians if degrees else float
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        if skip_header:
+            next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            start_inclusive = row[2].strip() not in ('0', '') if len(row) > 2 else True
+            end_inclusive = row[3].strip() not in ('0', '') if len(row) > 3 else True
+            yield AngleRange(convert(float(row[0])), convert(float(row[1])), start_inclusive, end_inclusive)
+
+
+def read_ranges_csv(path, degrees=False, skip_header=False):
+    """Чтение промежутков из CSV в список AngleRange"""
+    return list(iter_ranges_csv(path, degrees, skip_header))
+
+
+def write_ranges_csv(path, ranges):
+    """Запись промежутков в CSV"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        f.writelines(f'{r.start.radians!r},{r.end.radians!r},{int(r.start_inclusive)},{int(r.end_inclusive)}\n'
+                     for r in ranges)
+
+
+def iter_ranges_binary(path):
+    """Потоковое чтение промежутков из бинарного файла записей RANGE_RECORD"""
+    with _mapped(path) as data:
+        for start, end, start_inclusive, end_inclusive in RANGE_RECORD.iter_unpack(data):
+            yield AngleRange(start, end, start_inclusive, end_inclusive)
+
+
+def read_ranges_binary(path):
+    """Чтение промежутков из бинарного файла в список AngleRange"""
+    return list(iter_ranges_binary(path))
+
+
+def write_ranges_binary(path, ranges):
+    """Запись промежутков в бинарный файл записей RANGE_RECORD"""
+    pack = RANGE_RECORD.pack
+    with open(path, 'wb') as f:
+        f.write(b''.join(pack(r.start.radians, r.end.radians, bool(r.start_inclusive), bool(r.end_inclusive))
+                         for r in ranges))
+
+# endregion
@@ -0,0 +1,152 @@
+from angle_class import AngleRange, PI, normalize_radians
+
+TWO_PI = 2 * PI
+
+
+def _after_lo(value, lo, lo_inclusive):
+    """value лежит правее левой границы отрезка"""
+    return value > lo or (value == lo and lo_inclusive)
+
+
+def _before_hi(value, hi, hi_inclusive):
+    """value лежит левее правой границы отрезка"""
+    return value < hi or (value == hi and hi_inclusive)
+
+
+def _segments_overlap(a, b):
+    """Пересечение двух отрезков (lo, hi, lo_inclusive, hi_inclusive, ...)"""
+    a_lo, a_hi, a_lo_inc, a_hi_inc = a[:4]
+    b_lo, b_hi, b_lo_inc, b_hi_inc = b[:4]
+    if a_hi < b_lo or b_hi < a_lo:
+        return False
+    if a_hi == b_lo and not (a_hi_inc and b_lo_inc):
+        return False
+    if b_hi == a_lo and not (b_hi_inc and a_lo_inc):
+        return False
+    return True
+
+
+class _Node:
+    """Узел центрированного дерева интервалов"""
+
+    __slots__ = ('center', 'by_lo', 'by_hi', 'left', 'right')
+
+    def __init__(self, segments):
+        los = sorted(s[0] for s in segments)
+        self.center = los[len(los) // 2]
+
+        here, left, right = [], [], []
+        for segment in segments:
+            if segment[1] < self.center:
+                left.append(segment)
+            elif segment[0] > self.center:
+                right.append(segment)
+            else:
+                here.append(segment)
+
+        self.by_lo = sorted(here, key=lambda s: s[0])
+        self.by_hi = sorted(here, key=lambda s: s[1], reverse=True)
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+
+class AngleRangeIndex:
+    """
+    Индекс промежутков углов для быстрых запросов вхождения и пересечения.
+    Промежутки, пересекающие 0, хранятся как два отрезка в [0, 2*pi].
+    Запросы выполняются за O(log n + k) по дереву интервалов.
+    """
+
+    def __init__(self, ranges=()):
+        self._ranges = []
+        self._root = None
+        self._dirty = False
+        for angle_range in ranges:
+            self.add(angle_range)
+
+    def add(self, angle_range):
+        """Добавление промежутка, дерево перестраивается при следующем запросе"""
+        if not isinstance(angle_range, AngleRange):
+            raise TypeError("Значение должно быть AngleRange")
+        self._ranges.append(angle_range)
+        self._dirty = True
+
+    def _tree(self):
+        if self._dirty:
+            segments = [segment + (angle_range,)
+                        for angle_range in self._ranges
+                        for segment in angle_range._segments()]
+            self._root = _Node(segments) if segments else None
+            self._dirty = False
+        return self._root
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def __iter__(self):
+        return iter(self._ranges)
+
+    def stab(self, item):
+        """Все промежутки, содержащие угол"""
+        angle = normalize_radians(item)
+
+        found = {}
+        node = self._tree()
+        while node is not None:
+            if angle < node.center:
+                # Все отрезки узла заканчиваются правее angle, проверяем левую границу
+                for segment in node.by_lo:
+                    if segment[0] > angle:
+                        break
+                    if _after_lo(angle, segment[0], segment[2]) and _before_hi(angle, segment[1], segment[3]):
+                        found[id(segment[4])] = segment[4]
+                node = node.left
+            elif angle > node.center:
+                for segment in node.by_hi:
+                    if segment[1] < angle:
+                        break
+                    if _after_lo(angle, segment[0], segment[2]) and _before_hi(angle, segment[1], segment[3]):
+                        found[id(segment[4])] = segment[4]
+                node = node.right
+            else:
+                for segment in node.by_lo:
+                    if _after_lo(angle, segment[0], segment[2]) and _before_hi(angle, segment[1], segment[3]):
+                        found[id(segment[4])] = segment[4]
+                break
+        return list(found.values())
+
+    def overlap(self, angle_range):
+        """Все промежутки, пересекающиеся с заданным"""
+        if not isinstance(angle_range, AngleRange):
+            raise TypeError("Значение должно быть AngleRange")
+
+        found = {}
+        for query in angle_range._segments():
+            stack = [self._tree()]
+            while stack:
+                node = stack.pop()
+                if node is None:
+                    continue
+                if query[1] < node.center:
+                    candidates = []
+                    for segment in node.by_lo:
+                        if segment[0] > query[1]:
+                            break
+                        candidates.append(segment)
+                    stack.append(node.left)
+                elif query[0] > node.center:
+                    candidates = []
+                    for segment in node.by_hi:
+                        if segment[1] < query[0]:
+                            break
+                        candidates.append(segment)
+                    stack.append(node.right)
+                else:
+                    candidates = node.by_lo
+                    stack.append(node.left)
+                    stack.append(node.right)
+
+                for segment in candidates:
+                    if _segments_overlap(segment, query):
+                        found[id(segment[4])] = segment[4]
+        return list(found.values())
@@ -0,0 +1,103 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+from angle_class import AngleRange, PI
+from angle_range_index import _segments_overlap
+
+TWO_PI = 2 * PI
+
+
+def _split(ranges):
+    """Отрезки (lo, hi, lo_inclusive, hi_inclusive, номер промежутка, номер части)"""
+    segments = []
+    parts = {}
+    for idx, angle_range in enumerate(ranges):
+        if not isinstance(angle_range, AngleRange):
+            raise TypeError("Значение должно быть AngleRange")
+        pieces = [segment + (idx, part) for part, segment in enumerate(angle_range._segments())]
+        segments.extend(pieces)
+        if len(pieces) > 1:
+            parts[idx] = pieces
+    return segments, parts
+
+
+def _is_canonical(a, b, left_parts, right_parts):
+    """
+    Промежуток, пересекающий 0, состоит из двух отрезков, поэтому одна пара промежутков
+    может пересекаться несколькими парами отрезков. Пара выдается только для отрезков
+    с самой левой точкой начала пересечения.
+    """
+    left = left_parts.get(a[4])
+    right = right_parts.get(b[4])
+    if left is None and right is None:
+        return True
+    key = (max(a[0], b[0]), a[5], b[5])
+    for x in left or (a,):
+        for y in right or (b,):
+            if _segments_overlap(x, y) and (max(x[0], y[0]), x[5], y[5]) < key:
+                return False
+    return True
+
+
+def _sweep(left, right, left_parts, right_parts, shard_lo=0.0, shard_hi=TWO_PI):
+    """
+    Заметание по левым границам отрезков. Пара учитывается в секторе,
+    в который попадает начало пересечения, поэтому секторы не дают повторов.
+    """
+    events = sorted([(s[0], 0, s) for s in left] + [(s[0], 1, s) for s in right],
+                    key=lambda e: (e[0], e[1]))
+    active = ([], [])
+    counter = 0
+    for lo, side, segment in events:
+        other = active[1 - side]
+        while other and other[0][0] < lo:
+            heapq.heappop(other)
+        for _, _, candidate in other:
+            a, b = (segment, candidate) if side == 0 else (candidate, segment)
+            start = max(a[0], b[0])
+            if (shard_lo <= start < shard_hi and _segments_overlap(a, b)
+                    and _is_canonical(a, b, left_parts, right_parts)):
+                yield a[4], b[4]
+        heapq.heappush(active[side], (segment[1], counter, segment))
+        counter += 1
+
+
+def _join_shard(args):
+    """Обработка одного сектора окружности в отдельном процессе"""
+    return list(_sweep(*args))
+
+
+def _shard_args(left, right, left_parts, right_parts, shards):
+    step = TWO_PI / shards
+    for k in range(shards):
+        shard_lo = k * step
+        shard_hi = TWO_PI if k == shards - 1 else (k + 1) * step
+        # В сектор попадают отрезки, которые его задевают; повторы отсекаются по началу пересечения
+        yield ([s for s in left if s[0] < shard_hi and s[1] >= shard_lo],
+               [s for s in right if s[0] < shard_hi and s[1] >= shard_lo],
+               left_parts, right_parts, shard_lo, shard_hi)
+
+
+def overlap_join(left, right, processes=None, shards=None):
+    """
+    Генератор всех пар (промежуток из left, промежуток из right), имеющих общие углы.
+    processes=None - заметание в текущем процессе; иначе окружность делится на shards
+    секторов (по умолчанию 4 * processes), которые обрабатываются в пуле процессов,
+    а пары выдаются по мере готовности секторов.
+    """
+    left = list(left)
+    right = list(right)
+    left_segments, left_parts = _split(left)
+    right_segments, right_parts = _split(right)
+
+    if processes is None:
+        for i, j in _sweep(left_segments, right_segments, left_parts, right_parts):
+            yield left[i], right[j]
+        return
+
+    shards = shards or 4 * processes
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        tasks = _shard_args(left_segments, right_segments, left_parts, right_parts, shards)
+        for pairs in executor.map(_join_shard, tasks):
+            for i, j in pairs:
+                yield left[i], right[j]
@@ -0,0 +1,196 @@
+from bisect import bisect_right
+from heapq import merge
+
+from angle_class import Angle, AngleRange, PI, normalize_radians
+
+TWO_PI = 2 * PI
+
+
+def _is_empty(lo, hi, lo_inclusive, hi_inclusive):
+    return lo > hi or (lo == hi and not (lo_inclusive and hi_inclusive))
+
+
+def _sort_key(segment):
+    # При равной левой границе включающий отрезок идет первым
+    return segment[0], not segment[2]
+
+
+def _merge_sorted(segments):
+    """Слияние отсортированных отрезков в непересекающиеся за один проход"""
+    result = []
+    for lo, hi, lo_inc, hi_inc in segments:
+        if _is_empty(lo, hi, lo_inc, hi_inc):
+            continue
+        if result:
+            last_lo, last_hi, last_lo_inc, last_hi_inc = result[-1]
+            if lo < last_hi or (lo == last_hi and (last_hi_inc or lo_inc)):
+                if hi > last_hi:
+                    result[-1] = (last_lo, hi, last_lo_inc, hi_inc)
+                elif hi == last_hi:
+                    result[-1] = (last_lo, hi, last_lo_inc, last_hi_inc or hi_inc)
+                continue
+        result.append((lo, hi, lo_inc, hi_inc))
+    return result
+
+
+class AngleRangeSet:
+    """
+    Множество углов в виде отсортированных непересекающихся дуг окружности.
+    Дуги хранятся как отрезки (lo, hi, lo_inclusive, hi_inclusive) внутри [0, 2*pi),
+    дуга через 0 - как два отрезка. Операции выполняются за один проход.
+    """
+
+    def __init__(self, ranges=()):
+        segments = []
+        for angle_range in ranges:
+            if not isinstance(angle_range, AngleRange):
+                raise TypeError("Значение должно быть AngleRange")
+            segments.extend(self._clip(segment) for segment in angle_range._segments())
+        segments.sort(key=_sort_key)
+        self._set_segments(_merge_sorted(segments))
+
+    @staticmethod
+    def _clip(segment):
+        """Точка 2*pi совпадает с 0, поэтому правая граница 2*pi всегда исключается"""
+        lo, hi, lo_inc, hi_inc = segment
+        if hi == TWO_PI:
+            return lo, hi, lo_inc, False
+        return segment
+
+    def _set_segments(self, segments):
+        self._segments = segments
+        self._los = [segment[0] for segment in segments]
+        self._length = sum(hi - lo for lo, hi, _, _ in segments)
+
+    @classmethod
+    def _from_segments(cls, segments):
+        obj = cls.__new__(cls)
+        obj._set_segments(segments)
+        return obj
+
+    def ranges(self):
+        """
+        Список AngleRange; отрезки у 2*pi и у 0 склеиваются в дугу через 0,
+        если у нее различаются начало и конец (иначе AngleRange примет ее за точку)
+        """
+        segments = self._segments
+        if (len(segments) > 1 and segments[-1][1] == TWO_PI
+                and segments[0][0] == 0.0 and segments[0][2]
+                and segments[-1][0] > segments[0][1]):
+            first, last = segments[0], segments[-1]
+            wrapped = AngleRange(last[0], first[1], last[2], first[3])
+            return [AngleRange(lo, hi, lo_inc, hi_inc) for lo, hi, lo_inc, hi_inc in segments[1:-1]] + [wrapped]
+        return [AngleRange(lo, hi, lo_inc, hi_inc) for lo, hi, lo_inc, hi_inc in segments]
+
+    def __iter__(self):
+        return iter(self.ranges())
+
+    def __len__(self):
+        return len(self.ranges())
+
+    def __bool__(self):
+        return bool(self._segments)
+
+    def __abs__(self):
+        """Суммарная длина дуг в радианах (вычисляется при создании)"""
+        return self._length
+
+    def __contains__(self, item):
+        if isinstance(item, (Angle, int, float)):
+            angle = normalize_radians(item)
+        elif isinstance(item, AngleRange):
+            return not AngleRangeSet([item]) - self
+        elif isinstance(item, AngleRangeSet):
+            return not item - self
+        else:
+            return False
+
+        i = bisect_right(self._los, angle) - 1
+        if i < 0:
+            return False
+        lo, hi, lo_inc, hi_inc = self._segments[i]
+        return (angle > lo or lo_inc) and (angle < hi or (angle == hi and hi_inc))
+
+    def _coerce(self, other):
+        if isinstance(other, AngleRangeSet):
+            return other
+        if isinstance(other, AngleRange):
+            return AngleRangeSet([other])
+        return None
+
+    def union(self, other):
+        """Объединение"""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._from_segments(_merge_sorted(merge(self._segments, other._segments, key=_sort_key)))
+
+    def intersection(self, other):
+        """Пересечение"""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        a, b = self._segments, other._segments
+        result = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            a_lo, a_hi, a_lo_inc, a_hi_inc = a[i]
+            b_lo, b_hi, b_lo_inc, b_hi_inc = b[j]
+
+            if a_lo > b_lo:
+                lo, lo_inc = a_lo, a_lo_inc
+            elif b_lo > a_lo:
+                lo, lo_inc = b_lo, b_lo_inc
+            else:
+                lo, lo_inc = a_lo, a_lo_inc and b_lo_inc
+
+            if a_hi < b_hi:
+                hi, hi_inc = a_hi, a_hi_inc
+                i += 1
+            elif b_hi < a_hi:
+                hi, hi_inc = b_hi, b_hi_inc
+                j += 1
+            else:
+                hi, hi_inc = a_hi, a_hi_inc and b_hi_inc
+                i += 1
+                j += 1
+
+            if not _is_empty(lo, hi, lo_inc, hi_inc):
+                result.append((lo, hi, lo_inc, hi_inc))
+        return self._from_segments(result)
+
+    def complement(self):
+        """Дополнение до полной окружности"""
+        result = []
+        cursor, cursor_inc = 0.0, True
+        for lo, hi, lo_inc, hi_inc in self._segments:
+            if not _is_empty(cursor, lo, cursor_inc, not lo_inc):
+                result.append((cursor, lo, cursor_inc, not lo_inc))
+            cursor, cursor_inc = hi, not hi_inc
+        if not _is_empty(cursor, TWO_PI, cursor_inc, False):
+            result.append((cursor, TWO_PI, cursor_inc, False))
+        return self._from_segments(result)
+
+    def difference(self, other):
+        """Разность"""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self.intersection(other.complement())
+
+    __or__ = union
+    __add__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __invert__ = complement
+
+    def __eq__(self, other):
+        if not isinstance(other, AngleRangeSet):
+            return False
+        return self._segments == other._segments
+
+    def __str__(self):
+        return '{' + ', '.join(str(r) for r in self.ranges()) + '}'
+
+    def __repr__(self):
+        return f"AngleRangeSet({self.ranges()!r})"
@@ -0,0 +1,93 @@
+from array import array
+from bisect import bisect_left
+
+from angle_class import Angle, PI
+from angle_array import AngleArray
+
+TWO_PI = 2 * PI
+
+
+def circular_distance(a, b):
+    """Расстояние между углами на окружности (в радианах, от 0 до pi)"""
+    d = (float(a) - float(b)) % TWO_PI
+    return min(d, TWO_PI - d)
+
+
+class AngleSearchIndex:
+    """
+    Индекс поиска ближайших углов из неизменяемого каталога.
+    Нормализованные значения хранятся отсортированными в array('d'),
+    запрос - бинарный поиск с переходом через 0.
+    """
+
+    def __init__(self, angles):
+        """angles - AngleArray или итерируемое Angle/чисел (в радианах)"""
+        if isinstance(angles, AngleArray):
+            references = angles.to_angles()
+        else:
+            references = [a if isinstance(a, Angle) else Angle(a) for a in angles]
+        if not references:
+            raise ValueError("Каталог углов не может быть пустым")
+
+        order = sorted(range(len(references)), key=lambda i: references[i]._normal_ang)
+        self._angles = [references[i] for i in order]
+        self._values = array('d', (a._normal_ang for a in self._angles))
+
+    def __len__(self):
+        return len(self._values)
+
+    @staticmethod
+    def _normalize(angle):
+        if isinstance(angle, Angle):
+            return angle._normal_ang
+        elif isinstance(angle, (int, float)):
+            return float(angle) % TWO_PI
+        else:
+            raise TypeError("Значение должно быть Angle, int или float")
+
+    def _nearest_position(self, value):
+        values = self._values
+        n = len(values)
+        i = bisect_left(values, value)
+        right = i % n
+        left = (i - 1) % n
+        right_distance = (values[right] - value) % TWO_PI
+        left_distance = (value - values[left]) % TWO_PI
+        return right if right_distance <= left_distance else left
+
+    def nearest(self, angle):
+        """Ближайший к angle угол каталога"""
+        return self._angles[self._nearest_position(self._normalize(angle))]
+
+    def k_nearest(self, angle, k):
+        """k ближайших углов каталога, от ближнего к дальнему"""
+        value = self._normalize(angle)
+        values = self._values
+        n = len(values)
+        k = min(k, n)
+
+        # Два указателя расходятся от точки вставки: вправо (против часовой) и влево
+        right = bisect_left(values, value)
+        left = right - 1
+        result = []
+        while len(result) < k:
+            right_distance = (values[right % n] - value) % TWO_PI
+            left_distance = (value - values[left % n]) % TWO_PI
+            if right_distance <= left_distance:
+                result.append(self._angles[right % n])
+                right += 1
+            else:
+                result.append(self._angles[left % n])
+                left -= 1
+        return result
+
+    def nearest_many(self, angles):
+        """Ближайшие углы каталога для каждого угла из AngleArray или итерируемого"""
+        if isinstance(angles, AngleArray):
+            values = angles._normal_ang
+        else:
+            values = map(self._normalize, angles)
+        return [self._angles[self._nearest_position(v)] for v in values]
+
+    def __repr__(self):
+        return f"AngleSearchIndex({self._angles!r})"
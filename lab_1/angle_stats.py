@@ -0,0 +1,114 @@
+import math
+
+from angle_class import Angle, PI
+from angle_array import AngleArray
+
+TWO_PI = 2 * PI
+
+
+class CircularStats:
+    """
+    Потоковая статистика по углам: круговое среднее, длина результирующего вектора,
+    круговая дисперсия и гистограмма по секторам.
+    Хранит O(1) сумм и O(bins) счетчиков, частичные результаты можно объединять.
+    """
+
+    def __init__(self, bins=0):
+        """bins - число равных секторов гистограммы на [0, 2*pi), 0 - без гистограммы"""
+        if bins < 0:
+            raise ValueError("Число секторов не может быть отрицательным")
+        self.count = 0
+        self._sum_sin = 0.0
+        self._sum_cos = 0.0
+        self._bins = [0] * bins
+        self._bin_scale = bins / TWO_PI
+
+    @staticmethod
+    def _to_radians(value):
+        if isinstance(value, Angle):
+            return value.radians
+        elif isinstance(value, (int, float)):
+            return float(value)
+        else:
+            raise TypeError("Значение должно быть Angle, int или float")
+
+    def add(self, angle):
+        """Учет одного угла"""
+        radians = self._to_radians(angle)
+        self.count += 1
+        self._sum_sin += math.sin(radians)
+        self._sum_cos += math.cos(radians)
+        if self._bins:
+            self._bins[self._bin_index(radians)] += 1
+
+    def add_many(self, angles):
+        """Учет пакета углов (AngleArray или итерируемое Angle/чисел)"""
+        if isinstance(angles, AngleArray):
+            values = angles._radians
+        else:
+            values = [self._to_radians(a) for a in angles]
+        self.count += len(values)
+        self._sum_sin += math.fsum(map(math.sin, values))
+        self._sum_cos += math.fsum(map(math.cos, values))
+        if self._bins:
+            bins = self._bins
+            for index in map(self._bin_index, values):
+                bins[index] += 1
+
+    def _bin_index(self, radians):
+        # min защищает от округления вверх для углов чуть меньше 2*pi
+        return min(int((radians % TWO_PI) * self._bin_scale), len(self._bins) - 1)
+
+    def merge(self, other):
+        """Объединение с результатом другого накопителя (например, из другого процесса)"""
+        if not isinstance(other, CircularStats):
+            raise TypeError("Можно объединять только CircularStats")
+        if len(other._bins) != len(self._bins):
+            raise ValueError("Число секторов гистограмм должно совпадать")
+        self.count += other.count
+        self._sum_sin += other._sum_sin
+        self._sum_cos += other._sum_cos
+        self._bins = [a + b for a, b in zip(self._bins, other._bins)]
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def __add__(self, other):
+        result = CircularStats(len(self._bins))
+        return result.merge(self).merge(other)
+
+    @property
+    def mean(self):
+        """Круговое среднее (Angle в [0, 2*pi)) или None, если оно не определено"""
+        if self.resultant_length < 1e-12:
+            return None
+        return Angle(radians=math.atan2(self._sum_sin, self._sum_cos) % TWO_PI)
+
+    @property
+    def resultant_length(self):
+        """Средняя длина результирующего вектора R в [0, 1]"""
+        if self.count == 0:
+            return 0.0
+        return math.hypot(self._sum_sin, self._sum_cos) / self.count
+
+    @property
+    def variance(self):
+        """Круговая дисперсия 1 - R"""
+        return 1.0 - self.resultant_length
+
+    @property
+    def std(self):
+        """Круговое стандартное отклонение sqrt(-2 ln R)"""
+        length = self.resultant_length
+        if length < 1e-12:
+            return math.inf
+        return math.sqrt(-2.0 * math.log(min(length, 1.0)))
+
+    @property
+    def histogram(self):
+        """Счетчики по секторам [i * 2*pi / bins, (i + 1) * 2*pi / bins)"""
+        return list(self._bins)
+
+    def __repr__(self):
+        return f"CircularStats(count={self.count}, mean={self.mean!r}, resultant_length={self.resultant_length:.6f})"
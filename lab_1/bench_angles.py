@@ -0,0 +1,130 @@
+"""
+Бенчмарк операций lab_1: создание углов, сравнения, вхождение в промежуток,
+объединение/разность промежутков и сортировка.
+
+Результаты выводятся в stdout в формате JSON Lines (одна строка на замер)
+и при необходимости сохраняются в файл для сравнения с будущими запусками:
+
+    python bench_angles.py --sizes 1000 100000 --output before.jsonl
+    python bench_angles.py --sizes 1000 100000 --baseline before.jsonl
+
+С --baseline скрипт завершается с кодом 1, если какой-то замер стал
+медленнее базового больше чем на --tolerance (по умолчанию 20%).
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+
+# angle_class при импорте печатает демонстрацию, она не должна попасть в JSON
+with contextlib.redirect_stdout(io.StringIO()):
+    from angle_class import Angle, AngleRange, PI
+
+
+def best_time(func, repeat):
+    """Лучшее время из repeat запусков в секундах"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_cases(n, rng):
+    values = [rng.uniform(-4 * PI, 4 * PI) for _ in range(n)]
+    angles = [Angle(v) for v in values]
+    others = angles[1:] + angles[:1]
+    ranges = [AngleRange(rng.uniform(0, 2 * PI), rng.uniform(0, 2 * PI)) for _ in range(n)]
+    other_ranges = ranges[1:] + ranges[:1]
+
+    def construct():
+        for v in values:
+            Angle(v)
+
+    def compare():
+        for a, b in zip(angles, others):
+            a < b
+            a == b
+
+    def contains():
+        for a, r in zip(angles, ranges):
+            a in r
+
+    def add():
+        for r1, r2 in zip(ranges, other_ranges):
+            r1 + r2
+
+    def sub():
+        for r1, r2 in zip(ranges, other_ranges):
+            r1 - r2
+
+    def sort():
+        sorted(angles)
+
+    return {
+        'construct': construct,
+        'compare': compare,
+        'range_contains': contains,
+        'range_add': add,
+        'range_sub': sub,
+        'sort': sort,
+    }
+
+
+def run(sizes, repeat, seed):
+    for n in sizes:
+        cases = make_cases(n, random.Random(seed))
+        for name, func in cases.items():
+            seconds = best_time(func, repeat)
+            yield {
+                'benchmark': name,
+                'n': n,
+                'seconds': seconds,
+                'ns_per_item': seconds / n * 1e9,
+                'python': platform.python_version(),
+            }
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        return {(r['benchmark'], r['n']): r for r in map(json.loads, f) if r}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Бенчмарк классов Angle и AngleRange')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 3, 10 ** 4, 10 ** 5],
+                        help='размеры входных данных (до 10^7, время растет линейно)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='файл для сохранения результатов (JSON Lines)')
+    parser.add_argument('--baseline', help='файл с результатами прошлого запуска')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    results = []
+    regressions = 0
+    for result in run(args.sizes, args.repeat, args.seed):
+        base = baseline.get((result['benchmark'], result['n']))
+        if base is not None:
+            result['baseline_seconds'] = base['seconds']
+            result['ratio'] = result['seconds'] / base['seconds']
+            result['regression'] = result['ratio'] > 1 + args.tolerance
+            regressions += result['regression']
+        results.append(result)
+        print(json.dumps(result), flush=True)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(r) + '\n' for r in results)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from angle_class import Angle, CompactAngle, PI
+
+
+class DictAngle(Angle):
+    """Угол с __dict__, как у Angle до добавления __slots__ (для сравнения памяти)"""
+
+
+def measure_memory(cls, values):
+    """Память в байтах на один экземпляр"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    angles = [cls(v) for v in values]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # Вычитаем сам список ссылок
+    return (total - sys.getsizeof(angles)) / len(angles)
+
+
+def measure_sort(cls, values, repeat=3):
+    """Лучшее время сортировки в секундах"""
+    best = float('inf')
+    for _ in range(repeat):
+        angles = [cls(v) for v in values]
+        start = time.perf_counter()
+        angles.sort()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+random.seed(0)
+values = [random.uniform(-4 * PI, 4 * PI) for _ in range(n)]
+
+print(f"\n### Бенчмарк Angle / CompactAngle, n = {n}")
+print(f"{'класс':<14}{'байт/угол':>12}{'сортировка, с':>16}")
+for cls in (DictAngle, Angle, CompactAngle):
+    print(f"{cls.__name__:<14}{measure_memory(cls, values):>12.1f}{measure_sort(cls, values):>16.4f}")
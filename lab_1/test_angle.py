@@ -92,3 +92,25 @@ print(f"str(ang_f): '{str_val}'")
 repr_val = repr(ang_f)
 print(f"repr(ang_f): '{repr_val}'")
 
+
+print("\n### CompactAngle (кэш нормализованного значения, __slots__)")
+from angle_class import CompactAngle
+
+cang1 = CompactAngle(degrees=450)                   # нормализованное значение считается один раз
+cang2 = CompactAngle(radians=PI / 2, frozen=True)   # неизменяемый угол
+print(f"cang1 == cang2 (450° == 90°): {cang1 == cang2}")  # True
+print(f"cang1 < Angle(degrees=180): {cang1 < Angle(degrees=180)}")  # True
+print(f"sorted: {sorted([CompactAngle(3.0), CompactAngle(7.0), CompactAngle(1.0)])}")
+print(f"{{cang2: 'север'}}[CompactAngle(PI / 2, frozen=True)]: {({cang2: 'север'})[CompactAngle(PI / 2, frozen=True)]}")
+import copy
+import pickle
+print(f"pickle: {pickle.loads(pickle.dumps(cang2))!r}, copy: {copy.deepcopy(cang1)!r}")  # frozen сохраняется
+
+print("\n### Тригонометрия")
+from angle_class import TRIG_TABLE
+
+ang_g = Angle(degrees=30)
+print(f"sin(30°): {ang_g.sin():.9f}, по таблице: {ang_g.sin(table=True):.9f}")
+print(f"cos(30°): {ang_g.cos():.9f}, по таблице: {ang_g.cos(table=True):.9f}")
+print(f"Погрешность таблицы не больше: {TRIG_TABLE.max_error:.1e}")
+print(f"Angle.atan2(1, 1): {Angle.atan2(1, 1)!r}")  # pi/4
@@ -0,0 +1,37 @@
+from angle_array import AngleArray
+from angle_class import Angle
+from math import pi
+
+PI = pi
+
+arr1 = AngleArray([0.5, 1.5708, 3.0])                 # Значения в радианах
+arr2 = AngleArray(radians=[PI / 2, PI, 2 * PI])       # Именованный параметр radians
+arr3 = AngleArray(degrees=[90, 450, 720])             # Именованный параметр degrees
+
+print(f"arr1 (радианы): {arr1}")
+print(f"arr2 (radians=...): {arr2}")
+print(f"arr3 (degrees=...): {arr3}")
+print(f"repr(arr3): {repr(arr3)}")
+print(f"arr3 нормализованный: {arr3.normalized()}")
+
+print("\n### Арифметические операции")
+print(f"arr1 + arr2 = {arr1 + arr2}")
+print(f"arr2 - Angle(1.0) = {arr2 - Angle(1.0)}")
+print(f"arr1 * 2 = {arr1 * 2}")
+print(f"arr1 / 4 = {arr1 / 4}")
+
+print("\n### Поэлементное сравнение")
+print(f"arr3 == Angle(degrees=90): {arr3 == Angle(degrees=90)}")  # [True, True, False]
+print(f"arr1 < arr2: {arr1 < arr2}")
+print(f"arr2 >= PI: {arr2 >= PI}")
+
+print("\n### Преобразование в Angle и обратно")
+angles = arr1.to_angles()
+print(f"arr1.to_angles(): {angles}")
+print(f"AngleArray.from_angles(...): {AngleArray.from_angles(angles)}")
+print(f"arr1[1]: {arr1[1]!r}, arr1[1:]: {arr1[1:]}")
+
+print("\n### Тригонометрия для всего массива")
+print(f"arr3.sin(): {[round(v, 6) for v in arr3.sin()]}")
+print(f"arr3.cos(table=True): {[round(v, 6) for v in arr3.cos(table=True)]}")
+print(f"AngleArray.atan2([1, 0], [0, -1]): {AngleArray.atan2([1, 0], [0, -1])}")  # [pi/2, pi]
@@ -0,0 +1,40 @@
+import os
+import tempfile
+
+from angle_class import Angle, AngleRange
+from angle_array import AngleArray
+from angle_io import (
+    read_angles_csv, write_angles_csv, read_angles_binary, write_angles_binary,
+    read_ranges_csv, write_ranges_csv, read_ranges_binary, iter_ranges_binary, write_ranges_binary
+)
+
+tmp_dir = tempfile.mkdtemp()
+csv_path = os.path.join(tmp_dir, 'angles.csv')
+bin_path = os.path.join(tmp_dir, 'angles.bin')
+
+angles = AngleArray(degrees=[0, 90, 180, 450])
+
+print("### Углы: CSV")
+write_angles_csv(csv_path, angles, degrees=True)
+print(f"Файл angles.csv: {open(csv_path).read().split()}")
+print(f"read_angles_csv(degrees=True): {read_angles_csv(csv_path, degrees=True)}")
+print(f"read_angles_csv(as_array=False): {read_angles_csv(csv_path, degrees=True, as_array=False)}")
+
+print("\n### Углы: бинарный файл float64 (mmap)")
+write_angles_binary(bin_path, angles)
+print(f"Размер angles.bin: {os.path.getsize(bin_path)} байт")  # 4 * 8
+print(f"read_angles_binary: {read_angles_binary(bin_path)}")
+write_angles_binary(bin_path, [Angle(1.0), Angle(degrees=30), 2.5])
+print(f"Из списка Angle: {read_angles_binary(bin_path, as_array=False)}")
+
+print("\n### Промежутки")
+ranges = [AngleRange(1.0, 3.0), AngleRange(Angle(degrees=350), Angle(degrees=10), end_inclusive=False)]
+write_ranges_csv(csv_path, ranges)
+print(f"read_ranges_csv: {read_ranges_csv(csv_path)}")
+write_ranges_binary(bin_path, ranges)
+print(f"read_ranges_binary: {read_ranges_binary(bin_path)}")
+print(f"Первый из потока: {next(iter_ranges_binary(bin_path))}")
+
+os.remove(csv_path)
+os.remove(bin_path)
+os.rmdir(tmp_dir)
@@ -0,0 +1,19 @@
+from angle_class import Angle
+from angle_array import AngleArray
+from angle_search import AngleSearchIndex, circular_distance
+
+catalogue = AngleSearchIndex([Angle(degrees=d) for d in (0, 45, 90, 180, 270, 350)])
+print(f"### Каталог: {len(catalogue)} углов")
+
+print("\n### Ближайший угол (с переходом через 0)")
+query = Angle(degrees=358)
+nearest = catalogue.nearest(query)
+print(f"358° -> {nearest!r}, расстояние {circular_distance(nearest, query):.4f} рад")  # 0°
+print(f"100° -> {catalogue.nearest(Angle(degrees=100))!r}")                             # 90°
+
+print("\n### k ближайших")
+print(f"3 ближайших к 10°: {catalogue.k_nearest(Angle(degrees=10), 3)}")  # 0°, 350°, 45°
+
+print("\n### Пакетный запрос")
+queries = AngleArray(degrees=[-5, 130, 300])
+print(f"{queries} -> {catalogue.nearest_many(queries)}")                  # 0°, 90° (130° ближе к 90°), 270°
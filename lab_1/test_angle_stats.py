@@ -0,0 +1,26 @@
+from angle_class import Angle
+from angle_array import AngleArray
+from angle_stats import CircularStats
+
+print("### Накопление по одному углу")
+stats = CircularStats(bins=4)
+for degrees in (350, 10, 20, 340):
+    stats.add(Angle(degrees=degrees))
+print(f"stats: {stats!r}")
+print(f"Среднее (ожидается ~0°): {stats.mean.radians:.6f} рад")
+print(f"Дисперсия: {stats.variance:.6f}, СКО: {stats.std:.6f}")
+print(f"Гистограмма по четвертям: {stats.histogram}")  # [2, 0, 0, 2]
+
+print("\n### Пакет и объединение частичных результатов")
+part1 = CircularStats(bins=4)
+part1.add_many(AngleArray(degrees=[80, 90, 100]))
+part2 = CircularStats(bins=4)
+part2.add_many([Angle(degrees=95), 1.5])
+total = part1 + part2
+print(f"part1 + part2: {total!r}")
+print(f"Гистограмма: {total.histogram}")  # [2, 3, 0, 0]
+
+print("\n### Противоположные углы")
+opposite = CircularStats()
+opposite.add_many(AngleArray(degrees=[0, 180]))
+print(f"Среднее не определено: {opposite.mean}, R = {opposite.resultant_length:.6f}")
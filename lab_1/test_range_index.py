@@ -0,0 +1,25 @@
+from angle_class import AngleRange, Angle
+from angle_range_index import AngleRangeIndex
+
+sectors = [
+    AngleRange(start=1.0, end=3.0),                                                  # [1.0 - 3.0]
+    AngleRange(start=2.5, end=4.0, start_inclusive=False),                           # (2.5 - 4.0]
+    AngleRange(start=Angle(degrees=350), end=Angle(degrees=10), end_inclusive=False),  # [350° - 10°) (Пересекает 0)
+    AngleRange(start=5.0, end=6.0),                                                  # [5.0 - 6.0]
+]
+index = AngleRangeIndex(sectors)
+
+print("### Индекс промежутков")
+print(f"Промежутков в индексе: {len(index)}")
+
+print("\n### Вхождение угла (stab)")
+print(f"Угол 2.7: {index.stab(Angle(2.7))}")                 # [1.0 - 3.0], (2.5 - 4.0]
+print(f"Угол 2.5: {index.stab(2.5)}")                        # только [1.0 - 3.0]
+print(f"Угол 0°: {index.stab(Angle(degrees=0))}")            # [350° - 10°)
+print(f"Угол 10°: {index.stab(Angle(degrees=10))}")          # [] (граница не включена)
+
+print("\n### Пересечение промежутков (overlap)")
+query = AngleRange(start=3.5, end=5.5)
+print(f"{query} пересекается с: {index.overlap(query)}")    # (2.5 - 4.0], [5.0 - 6.0]
+query = AngleRange(start=Angle(degrees=340), end=Angle(degrees=60))
+print(f"{query} пересекается с: {index.overlap(query)}")    # [350° - 10°), [5.0 - 6.0], [1.0 - 3.0]
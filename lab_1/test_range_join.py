@@ -0,0 +1,23 @@
+from angle_class import AngleRange, Angle
+from angle_range_join import overlap_join
+
+sectors_A = [
+    AngleRange(start=1.0, end=3.0),                                                  # [1.0 - 3.0]
+    AngleRange(start=Angle(degrees=350), end=Angle(degrees=10), end_inclusive=False),  # [350° - 10°) (Пересекает 0)
+    AngleRange(start=5.0, end=5.5),                                                  # [5.0 - 5.5]
+]
+sectors_B = [
+    AngleRange(start=2.5, end=4.0),                                                  # [2.5 - 4.0]
+    AngleRange(start=Angle(degrees=355), end=Angle(degrees=120)),                    # [355° - 120°] (Пересекает 0)
+    AngleRange(start=3.0, end=5.0, start_inclusive=False, end_inclusive=False),      # (3.0 - 5.0)
+]
+
+print("### Пересекающиеся пары (заметание в текущем процессе)")
+for range_a, range_b in overlap_join(sectors_A, sectors_B):
+    print(f"{range_a} x {range_b}")
+# [1.0 - 3.0] x [2.5 - 4.0], [1.0 - 3.0] x [355° - 120°], [350° - 10°) x [355° - 120°]
+
+if __name__ == '__main__':
+    print("\n### Те же пары, секторы окружности в пуле процессов")
+    for range_a, range_b in overlap_join(sectors_A, sectors_B, processes=2):
+        print(f"{range_a} x {range_b}")
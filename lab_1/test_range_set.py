@@ -0,0 +1,31 @@
+from angle_class import AngleRange, Angle
+from angle_range_set import AngleRangeSet
+
+range_A = AngleRange(start=1.0, end=3.0)                                           # [1.0 - 3.0]
+range_B = AngleRange(start=2.5, end=4.0)                                           # [2.5 - 4.0] (Перекрывается с A)
+range_C = AngleRange(start=5.0, end=6.0)                                           # [5.0 - 6.0]
+range_D = AngleRange(start=Angle(degrees=350), end=Angle(degrees=10), end_inclusive=False)  # [350° - 10°) (Пересекает 0)
+
+set1 = AngleRangeSet([range_A, range_B, range_C])
+set2 = AngleRangeSet([range_D, AngleRange(start=1.5, end=2.5, start_inclusive=False)])
+
+print("### Инициализация (дуги сортируются и склеиваются)")
+print(f"set1 = {set1}")                       # {[1.0 - 4.0], [5.0 - 6.0]}
+print(f"set2 = {set2}")
+print(f"repr(set1): {repr(set1)}")
+
+print("\n### Суммарная длина __abs__")
+print(f"длина set1: {abs(set1):.4f}")        # 3.0 + 1.0
+
+print("\n### Вхождение (__contains__)")
+print(f"Угол 3.5 in set1: {Angle(3.5) in set1}")                     # True
+print(f"Угол 4.5 in set1: {4.5 in set1}")                            # False
+print(f"Угол 0° in set2: {Angle(degrees=0) in set2}")                # True
+print(f"[1.2 - 3.8] in set1: {AngleRange(1.2, 3.8) in set1}")        # True
+
+print("\n### Операции с множествами")
+print(f"set1 | set2 = {set1 | set2}")
+print(f"set1 & set2 = {set1 & set2}")         # (1.5 - 2.5]
+print(f"set1 - set2 = {set1 - set2}")         # [1.0 - 1.5], (2.5 - 4.0], [5.0 - 6.0]
+print(f"~set1 = {~set1}")                     # (4.0 - 5.0), (6.0 - 1.0) (через 0)
+print(f"set1 + range_D = {set1 + range_D}")
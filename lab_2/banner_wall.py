@@ -0,0 +1,42 @@
+import os
+import time
+
+from printer_class import *
+
+# Пул процессов перезапускает этот модуль в дочерних процессах, поэтому демонстрация - под __main__
+if __name__ == '__main__':
+    Printer.load_font("font7.json")
+    small = FONTS.load("font5.json")
+    columns, rows = shutil.get_terminal_size()
+    processes = os.cpu_count() or 1
+
+    def fill(canvas):
+        # стена из сотен строк крупного текста, шрифты чередуются
+        y = 1
+        for number in range(200):
+            font = small if number % 2 else None
+            y = canvas.add(f"СТРОКА {number} СЪЕШЬ ЖЕ ЕЩЕ ЭТИХ МЯГКИХ БУЛОК", Color.GREEN, (1, y), "#",
+                           font, columns)
+
+    serial = Canvas()
+    fill(serial)
+    start = time.perf_counter()
+    frame = serial.render()
+    serial_time = time.perf_counter() - start
+
+    with Canvas(processes=processes) as canvas:
+        fill(canvas)
+        canvas.render()  # запуск процессов и загрузка шрифтов в них
+        start = time.perf_counter()
+        parallel_frame = canvas.render()
+        parallel_time = time.perf_counter() - start
+
+        # на экран выводится только то, что в него помещается
+        canvas.clear()
+        sys.stdout.write(AnsiCodes.CLEAR_SCREEN)
+        bottom = canvas.add("СТЕНА БАННЕРОВ", Color.YELLOW, (1, 1), "#", small, columns)
+        canvas.present()
+
+    sys.stdout.write(AnsiCodes.move_cursor(1, bottom))
+    print(f"Кадр {len(frame)} байт, совпадает: {frame == parallel_frame}")
+    print(f"Один процесс: {serial_time * 1000:.1f} мс, {processes} процессов: {parallel_time * 1000:.1f} мс")
@@ -0,0 +1,177 @@
+"""
+Бенчмарк отрисовки lab_2: скорость растеризации глифов шрифтами font5 и font7,
+объем вывода и число системных записей на кадр.
+
+Вывод идет в пустой приемник вместо терминала, поэтому измеряется только
+работа Printer. Результаты печатаются в формате JSON Lines, как в lab_1/bench_angles.py:
+
+    python bench_printer.py --output before.jsonl
+    python bench_printer.py --baseline before.jsonl
+
+С --baseline скрипт завершается с кодом 1, если какой-то замер стал
+медленнее базового больше чем на --tolerance (по умолчанию 20%).
+С --cold кэши глифов и раскладки строк очищаются перед каждым кадром.
+"""
+import argparse
+import contextlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from printer_class import Color, FrameBuffer, Printer, FONTS, layout_text
+
+FONT_FILES = ['font5.json', 'font7.json']
+
+# В шрифтах только кириллица; латиница рисуется пустыми глифами и проверяет этот путь
+TEXTS = {
+    'cyrillic': "СЪЕШЬ ЖЕ ЕЩЕ ЭТИХ МЯГКИХ ФРАНЦУЗСКИХ БУЛОК ДА ВЫПЕЙ ЧАЮ",
+    'latin': "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG",
+    'mixed': "ПРИВЕТ WORLD С НАСТУПАЮЩИМ 2025",
+}
+WIDTH = 160
+
+
+class NullSink:
+    """Замена sys.stdout: отбрасывает вывод, считая байты и вызовы записи"""
+
+    def __init__(self):
+        self.writes = 0
+        self.bytes = 0
+        # у приемника нет fileno(), поэтому _write_raw тоже пишет через buffer
+        self.buffer = self
+
+    def write(self, data):
+        self.writes += 1
+        self.bytes += len(data.encode('utf-8') if isinstance(data, str) else data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def make_cases(font, text):
+    frame = FrameBuffer(WIDTH, 64)
+
+    def print_static():
+        Printer.print_static(text, Color.GREEN, (1, 1), '#', font, WIDTH)
+
+    def printer_buffered():
+        with Printer(Color.GREEN, (1, 1), '#', font=font, width=WIDTH) as p:
+            p.print(text)
+
+    # отрисовка без терминала ничего не пишет в приемник и возвращает размер кадра
+    def render_into():
+        return Printer.render_into(bytearray(), text, Color.GREEN, (1, 1), '#', font, WIDTH)
+
+    def render_plain():
+        return len(Printer.render(text, Color.GREEN, (1, 1), '#', font, WIDTH, ansi=False))
+
+    def frame_buffer():
+        # кадр целиком меняется, чтобы present() выводил изменения каждый раз
+        frame.invalidate()
+        frame.clear()
+        frame.draw_text(text, Color.GREEN, (1, 1), '#', font, WIDTH)
+        frame.present()
+
+    return {
+        'print_static': print_static,
+        'printer_buffered': printer_buffered,
+        'render_into': render_into,
+        'render_plain': render_plain,
+        'frame_buffer': frame_buffer,
+    }
+
+
+def clear_caches(font):
+    font.cache.clear()
+    layout_text.cache_clear()
+
+
+def measure(func, font, frames, repeat, cold):
+    """Лучшее время кадра в секундах и счетчики вывода одного кадра"""
+    sink = NullSink()
+    with contextlib.redirect_stdout(sink):
+        func()
+        best = float('inf')
+        for _ in range(repeat):
+            elapsed = 0.0
+            for _ in range(frames):
+                if cold:
+                    clear_caches(font)
+                start = time.perf_counter()
+                func()
+                elapsed += time.perf_counter() - start
+            best = min(best, elapsed / frames)
+
+        # счетчики и память - по одному отдельному кадру, без влияния на время
+        sink.writes = sink.bytes = 0
+        if cold:
+            clear_caches(font)
+        tracemalloc.start()
+        produced = func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    written = sink.bytes if produced is None else produced
+    return best, sink.writes, written, peak
+
+
+def run(frames, repeat, cold):
+    for path in FONT_FILES:
+        font = FONTS.load(path)
+        for text_name, text in TEXTS.items():
+            glyphs = len(text.replace(' ', ''))
+            for name, func in make_cases(font, text).items():
+                seconds, writes, written, peak = measure(func, font, frames, repeat, cold)
+                yield {
+                    'benchmark': name,
+                    'font': font.name,
+                    'text': text_name,
+                    'cold': cold,
+                    'seconds_per_frame': seconds,
+                    'glyphs_per_second': glyphs / seconds,
+                    'bytes_per_frame': written,
+                    'writes_per_frame': writes,
+                    'peak_alloc_bytes': peak,
+                    'python': platform.python_version(),
+                }
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        return {(r['benchmark'], r['font'], r['text'], r['cold']): r for r in map(json.loads, f) if r}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Бенчмарк отрисовки Printer')
+    parser.add_argument('--frames', type=int, default=200, help='кадров в одном замере')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cold', action='store_true', help='очищать кэши перед каждым кадром')
+    parser.add_argument('--output', help='файл для сохранения результатов (JSON Lines)')
+    parser.add_argument('--baseline', help='файл с результатами прошлого запуска')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    results = []
+    regressions = 0
+    for result in run(args.frames, args.repeat, args.cold):
+        base = baseline.get((result['benchmark'], result['font'], result['text'], result['cold']))
+        if base is not None:
+            result['baseline_seconds'] = base['seconds_per_frame']
+            result['ratio'] = result['seconds_per_frame'] / base['seconds_per_frame']
+            result['regression'] = result['ratio'] > 1 + args.tolerance
+            regressions += result['regression']
+        results.append(result)
+        print(json.dumps(result), flush=True)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(r) + '\n' for r in results)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import json
+import mmap
+import struct
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple
+
+# Формат скомпилированного шрифта (.pfnt), все числа little-endian:
+#   заголовок: b'PFNT', версия (u8), высота глифа (u16), число глифов (u32)
+#   таблица смещений, отсортированная по коду символа: код (u32), ширина (u16), смещение (u32)
+#   битовые плоскости: для каждого глифа height строк по ceil(width / 8) байт, старший бит слева
+MAGIC = b'PFNT'
+VERSION = 1
+HEADER = struct.Struct('<4sBHI')
+ENTRY = struct.Struct('<IHI')
+PIXEL = '@'
+
+
+def _row_bytes(width: int) -> int:
+    return (width + 7) // 8
+
+
+def compile_font(json_path: str, out_path: str) -> None:
+    with open(json_path, encoding='utf-8') as f:
+        font: Dict[str, List[str]] = json.load(f)
+
+    height = len(next(iter(font.values()))) if font else 0
+    table = []
+    bitmaps = []
+    offset = 0
+    for char in sorted(font, key=ord):
+        rows = font[char]
+        if len(rows) != height:
+            raise ValueError(f"Глиф {char!r} высотой {len(rows)}, ожидалось {height}")
+        width = max((len(row) for row in rows), default=0)
+        data = bytearray()
+        for row in rows:
+            bits = 0
+            for column in range(_row_bytes(width) * 8):
+                bits = (bits << 1) | (column < len(row) and row[column] == PIXEL)
+            data += bits.to_bytes(_row_bytes(width), 'big')
+        table.append(ENTRY.pack(ord(char), width, offset))
+        bitmaps.append(bytes(data))
+        offset += len(data)
+
+    with open(out_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, height, len(table)))
+        f.write(b''.join(table))
+        f.write(b''.join(bitmaps))
+
+
+class BinaryFont(Mapping):
+    """
+    Скомпилированный шрифт, отображенный в память.
+    Таблица смещений читается при открытии, глифы декодируются при первом обращении.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.height, count = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            self._data.close()
+            raise ValueError(f"{path} не является шрифтом PFNT версии {VERSION}")
+
+        table_end = HEADER.size + count * ENTRY.size
+        self._bitmaps_start = table_end
+        self._entries: Dict[str, Tuple[int, int]] = {
+            chr(code): (width, offset)
+            for code, width, offset in ENTRY.iter_unpack(self._data[HEADER.size:table_end])
+        }
+        self._decoded: Dict[str, List[str]] = {}
+
+    def __getitem__(self, char: str) -> List[str]:
+        rows = self._decoded.get(char)
+        if rows is None:
+            width, offset = self._entries[char]
+            rows = self._decode(width, self._bitmaps_start + offset)
+            self._decoded[char] = rows
+        return rows
+
+    def _decode(self, width: int, start: int) -> List[str]:
+        size = _row_bytes(width)
+        rows = []
+        for row in range(self.height):
+            bits = int.from_bytes(self._data[start + row * size:start + (row + 1) * size], 'big')
+            shift = size * 8 - 1
+            rows.append(''.join(PIXEL if bits >> (shift - column) & 1 else ' ' for column in range(width)))
+        return rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        self._decoded.clear()
+        self._data.close()
+
+
+if __name__ == '__main__':
+    # python font_format.py font7.json [font7.pfnt]
+    source = sys.argv[1]
+    target = sys.argv[2] if len(sys.argv) > 2 else source.rsplit('.', 1)[0] + '.pfnt'
+    compile_font(source, target)
+    print(f"{source} -> {target}")
@@ -1,15 +1,62 @@
 from printer_class import *
 sys.stdout.write(AnsiCodes.CLEAR_SCREEN)
 
+# Если рядом есть font7.pfnt (python font_format.py font7.json), шрифт берется из него
 Printer.load_font("font7.json")
 
-Printer.print_static("ПРИВЕТ", Color.RED, (10, 10), "0")
+Printer.print_static("ПРИВЕТ", Color.RED, (10, 1), "0")
 
 
-with Printer(Color.GREEN, (1, 1), "0") as p:
-    p.print("С НАСТУПАЮЩИМ МИХАИЛ ДМИТРИЕВИЧ")
+# Внутри with вывод собирается в буфер и уходит в терминал одной записью,
+# длинный текст переносится по словам (здесь - в 120 колонок, по умолчанию - в ширину терминала)
+greeting = "С НАСТУПАЮЩИМ МИХАИЛ ДМИТРИЕВИЧ"
+with Printer(Color.GREEN, (1, 10), "0", width=120) as p:
+    p.print(greeting)
+font = Printer.resolve_font()
+y = 10 + len(layout_text(greeting, font, 120)) * (font.height + 1)
 
-# 2. Меняем шрифт на ходу (если есть второй файл)
-# if os.path.exists("font7.json"):
-#     Printer.load_font("font7.json")
-#     Printer.print_static("ДАЙТЕ ТАНК", Color.BLUE, (5, 25), "0")
+# Повторная отрисовка берет готовые строки глифов из кэша
+for _ in range(3):
+    Printer.print_static("ПРИВЕТ", Color.RED, (10, 1), "0")
+
+# Кадровый буфер: второй кадр выводит только изменившиеся ячейки
+frame = FrameBuffer(120, y + font.height)
+with Printer(Color.BLUE, (1, y), "0", frame=frame) as p:
+    p.print("ДАЙТЕ ТАНК")
+frame.clear()
+frame.draw_text("ДАЙТЕ ТАНКИ", Color.BLUE, (1, y), "0")
+frame.present()
+y += font.height + 2
+
+# Второй шрифт выбирается для отдельного принтера, остальные продолжают рисовать font7
+small = FONTS.load("font5.json")
+with Printer(Color.YELLOW, (1, y), "*", font=small) as p:
+    p.print("ДАЙТЕ ТАНК!")
+Printer.print_static("ПРИВЕТ", Color.RED, (10, 1), "0")
+
+
+
+# Асинхронный вывод: частые обновления одной области схлопываются в последнее
+async def status_board():
+    async with AsyncPrinter() as board:
+        for counter in range(10):
+            await board.print_static("ЖДИТЕ" + "!" * (counter % 4), Color.CYAN, (70, y), "#", font=small)
+        await board.join()
+    return board.coalesced
+
+coalesced = asyncio.run(status_board())
+
+# Отрисовка без терминала: кадры без ANSI-кодов копятся в одном буфере для записи одним вызовом
+banners = bytearray()
+for title in ("ЛОГ", "ОТЧЕТ"):
+    Printer.render_into(banners, title, Color.WHITE, (1, 1), "#", font=small, ansi=False)
+    banners += b'\n\n'
+
+cache = font.cache
+sys.stdout.write(AnsiCodes.move_cursor(1, y + small.height + 2) + Color.RESET.value)
+print(f"Шрифты: {FONTS.names()}")
+print(f"Строки приветствия: {layout_text(greeting, font, 120)}")
+print(f"Баннеры без ANSI: {len(banners)} байт")
+print(banners.decode('utf-8'))
+print(f"Схлопнуто кадров: {coalesced}")
+print(f"Кэш глифов font7: {len(cache)} шт., попаданий {cache.hits}, промахов {cache.misses}")
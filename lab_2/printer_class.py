@@ -1,8 +1,18 @@
 import sys
 import json
 import os
+import re
+import asyncio
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from enum import Enum
-from typing import Tuple, Dict, List
+from types import MappingProxyType
+from typing import Tuple, Dict, List, Optional, Hashable, Mapping, Sequence, Union
+
+from font_format import BinaryFont
 
 
 class AnsiCodes:
@@ -26,38 +36,584 @@ class Color(Enum):
     WHITE = "\033[37m"
     RESET = f'\033[0m'
 
+class GlyphCache:
+    """LRU-кэш готовых строк глифов: ключ (символ, заполнитель) -> строки в байтах"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict = OrderedDict()
+        # короткая блокировка только на время обращения к словарю, рендер идет без нее
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[bytes, ...]]:
+        with self._lock:
+            rows = self._items.get(key)
+            if rows is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(key)
+            return rows
+
+    def put(self, key: Hashable, rows: Tuple[bytes, ...]) -> None:
+        with self._lock:
+            self._items[key] = rows
+            self._items.move_to_end(key)
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def _write(data: bytes) -> None:
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(data.decode('utf-8'))
+        return
+    # текстовый слой мог накопить вывод, он должен уйти раньше байтов
+    sys.stdout.flush()
+    buffer.write(data)
+
+
+def _write_raw(data: bytes) -> None:
+    # запись напрямую в дескриптор stdout, минуя буферы io
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        _write(data)
+        return
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+class Font:
+    """Неизменяемая таблица глифов со своим кэшем готовых строк"""
+
+    def __init__(self, name: str, glyphs: Mapping[str, Sequence[str]], height: int,
+                 path: Optional[str] = None):
+        self.name = name
+        self.glyphs = glyphs
+        self.height = height
+        # файл, из которого загружен шрифт; по нему шрифт открывают процессы Canvas
+        self.path = path
+        self.width = len(next(iter(glyphs.values()))[0]) if glyphs else 0
+        self.cache = GlyphCache()
+        self._advances: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: str, name: Optional[str] = None) -> 'Font':
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        # рядом с JSON может лежать скомпилированный шрифт, он грузится быстрее
+        compiled = os.path.splitext(path)[0] + '.pfnt'
+        if not path.endswith('.pfnt') and os.path.exists(compiled) \
+                and os.path.getmtime(compiled) >= os.path.getmtime(path):
+            path = compiled
+
+        if path.endswith('.pfnt'):
+            glyphs = BinaryFont(path)
+            return cls(name, glyphs, glyphs.height, path)
+
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        glyphs = MappingProxyType({char: tuple(rows) for char, rows in data.items()})
+        height = len(next(iter(data.values()))) if data else 0
+        return cls(name, glyphs, height, path)
+
+    def pattern(self, char: str) -> Sequence[str]:
+        return self.glyphs.get(char) or self.glyphs.get(char.upper()) or self._blank()
+
+    def _blank(self) -> Sequence[str]:
+        return [' ' * self.width] * self.height
+
+    def advance(self, char: str) -> int:
+        # ширина глифа вместе с промежутком до следующего, считается один раз на символ;
+        # в форматах шрифтов нет кернинговых пар, промежуток между глифами всегда одна колонка
+        width = self._advances.get(char)
+        if width is None:
+            pattern = self.pattern(char)
+            width = (len(pattern[0]) if pattern else 0) + 1
+            self._advances[char] = width
+        return width
+
+    def measure(self, text: str) -> int:
+        return sum(map(self.advance, text))
+
+    def glyph(self, char: str, symbol: str) -> Tuple[bytes, ...]:
+        # строки без цвета: код цвета выводится один раз на строку кадра, а не на каждый глиф
+        key = (char, symbol)
+        rows = self.cache.get(key)
+        if rows is None:
+            # пробел после каждой строки глифа - промежуток между буквами
+            rows = tuple((line.replace('@', symbol) + ' ').encode('utf-8')
+                         for line in self.pattern(char))
+            self.cache.put(key, rows)
+        return rows
+
+    def __repr__(self):
+        return f"Font(name={self.name!r}, glyphs={len(self.glyphs)}, height={self.height})"
+
+
+class FontRegistry:
+    """Шрифты по именам; один раз загруженный шрифт разделяется всеми принтерами и потоками"""
+
+    def __init__(self):
+        self._fonts: Dict[str, Font] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str, name: Optional[str] = None) -> Font:
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        font = self._fonts.get(name)
+        if font is not None:
+            return font
+        with self._lock:
+            if name not in self._fonts:
+                self._fonts[name] = Font.load(path, name)
+            return self._fonts[name]
+
+    def register(self, font: Font) -> Font:
+        with self._lock:
+            self._fonts[font.name] = font
+        return font
+
+    def get(self, name: str) -> Font:
+        try:
+            return self._fonts[name]
+        except KeyError:
+            raise KeyError(f"Шрифт {name!r} не загружен") from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fonts
+
+    def names(self) -> List[str]:
+        return list(self._fonts)
+
+
+FONTS = FontRegistry()
+
+
+@lru_cache(maxsize=256)
+def layout_text(text: str, font: Font, width: int) -> Tuple[str, ...]:
+    # перенос по словам в width колонок, только если текст не помещается в строку;
+    # пробелы внутри строки сохраняются, на месте переноса - отбрасываются;
+    # слово длиннее строки режется по символам
+    if font.measure(text) <= width:
+        return (text,)
+    lines = []
+    current = ''
+    current_width = 0
+    for token in re.split(r'(\s+)', text):
+        if not token:
+            continue
+        token_width = font.measure(token)
+        if token.isspace():
+            # пробелы в начале текста сохраняются, в начале перенесенной строки - нет
+            if current or not lines:
+                current += token
+                current_width += token_width
+            continue
+        if current and current_width + token_width > width:
+            if current.strip():
+                lines.append(current.rstrip())
+            current, current_width = '', 0
+        if token_width > width:
+            for char in token:
+                char_width = font.advance(char)
+                if current and current_width + char_width > width:
+                    lines.append(current)
+                    current, current_width = '', 0
+                current += char
+                current_width += char_width
+        else:
+            current += token
+            current_width += token_width
+    if current.strip():
+        lines.append(current.rstrip())
+    return tuple(lines)
+
+
 class Printer:
-    _font = {}
-    _height = 0
+    _default_font: Optional[Font] = None
 
-    def __init__(self, color: Color, position: Tuple[int, int], symbol: str):
+    def __init__(self, color: Color, position: Tuple[int, int], symbol: str,
+                 frame: Optional['FrameBuffer'] = None, font: Union[str, Font, None] = None,
+                 buffer_size: int = 64 * 1024, width: Optional[int] = None):
         self.color = color
         self.position = position
         self.symbol = symbol
+        self.frame = frame
+        # шрифт по умолчанию запоминается при создании: следующий load_font() не меняет этот принтер
+        self.font = self.resolve_font(font) if font is not None or self._default_font is not None else None
+        # ширина для переноса строк, по умолчанию до правого края терминала
+        self.width = width
+        # внутри with вывод копится здесь и сбрасывается одним os.write
+        self.buffer_size = buffer_size
+        self._buffer: Optional[bytearray] = None
+        self.flush_count = 0
 
     def __enter__(self):
+        self._buffer = bytearray()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        sys.stdout.write(Color.RESET.value)
-        sys.stdout.flush()
+        if self.frame is not None:
+            self._buffer += self.frame.flip().encode('utf-8')
+        self._buffer += Color.RESET.value.encode()
+        self.flush()
+        self._buffer = None
+
+    def flush(self) -> None:
+        if self._buffer:
+            _write_raw(self._buffer)
+            self._buffer.clear()
+            self.flush_count += 1
+
+    def print(self, text: str) -> None:
+        width = self.width or max(shutil.get_terminal_size().columns - self.position[0] + 1, 1)
+        if self.frame is not None:
+            self.frame.draw_text(text, self.color, self.position, self.symbol, self.font, width)
+            return
+        data = self.render(text, self.color, self.position, self.symbol, self.font, width)
+        if self._buffer is None:
+            _write(data)
+            return
+        self._buffer += data
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    @classmethod
+    def print_static(cls, text: str, color: Color, position: Tuple[int, int], symbol: str,
+                     font: Union[str, Font, None] = None, width: Optional[int] = None) -> None:
+        _write(cls.render(text, color, position, symbol, font, width))
+
+    @classmethod
+    def render(cls, text: str, color: Color, position: Tuple[int, int], symbol: str,
+               font: Union[str, Font, None] = None, width: Optional[int] = None,
+               ansi: bool = True) -> bytes:
+        return b''.join(cls._render_parts(text, color, position, symbol, font, width, ansi))
+
+    @classmethod
+    def render_into(cls, target, text: str, color: Color, position: Tuple[int, int], symbol: str,
+                    font: Union[str, Font, None] = None, width: Optional[int] = None,
+                    ansi: bool = True, offset: int = 0) -> int:
+        """
+        Отрисовка без терминала. target - bytearray (кадр дописывается в конец),
+        memoryview (кадр записывается с позиции offset) или файловый объект с write().
+        Возвращает число записанных байт.
+        """
+        parts = cls._render_parts(text, color, position, symbol, font, width, ansi)
+        if isinstance(target, bytearray):
+            size = len(target)
+            for part in parts:
+                target += part
+            return len(target) - size
+        data = b''.join(parts)
+        if isinstance(target, memoryview):
+            if offset + len(data) > len(target):
+                raise ValueError(f"Кадр из {len(data)} байт не помещается в буфер с позиции {offset}")
+            target[offset:offset + len(data)] = data
+        else:
+            target.write(data)
+        return len(data)
 
     @classmethod
-    def print(cls, text: str, color: Color, position: Tuple[int, int], symbol: str):
+    def _render_parts(cls, text: str, color: Color, position: Tuple[int, int], symbol: str,
+                      font: Union[str, Font, None], width: Optional[int], ansi: bool):
+        # без ANSI цвет и позиция не выводятся: строки кадра разделяются переводом строки
+        font = cls.resolve_font(font)
         x, y = position
-        for row in range(cls._height):
-            sys.stdout.write(f'\033[{y + row};{x}H')
-            sys.stdout.write(color.value)
+        lines = layout_text(text, font, width) if width else (text,)
+        color_code = color.value.encode()
+        for number, line in enumerate(lines):
+            glyphs = [font.glyph(char, symbol) for char in line]
+            for row in range(font.height):
+                if ansi:
+                    yield AnsiCodes.move_cursor(x, y + row).encode()
+                    yield color_code
+                elif number or row:
+                    yield b'\n'
+                yield from (glyph[row] for glyph in glyphs)
+            # между строками текста - одна пустая строка терминала
+            y += font.height + 1
+            if not ansi and number < len(lines) - 1:
+                yield b'\n'
 
     @classmethod
-    def load_font(cls, path: str) -> Dict[str, List[str]]:
-        with open(path) as f:
-            cls._font = json.load(f)
-            if cls._font:
-                first_char = next(iter(cls._font))
-                cls._height = len(cls._font[first_char])
+    def resolve_font(cls, font: Union[str, Font, None] = None) -> Font:
+        if isinstance(font, str):
+            return FONTS.get(font)
+        if font is not None:
+            return font
+        if cls._default_font is None:
+            raise RuntimeError("Шрифт не загружен, вызовите Printer.load_font()")
+        return cls._default_font
+
+    @classmethod
+    def load_font(cls, path: str) -> Font:
+        # шрифт по умолчанию для принтеров, которым не задан свой
+        cls._default_font = FONTS.load(path)
+        return cls._default_font
+
+
+class FrameBuffer:
+    """
+    Двойной буфер экрана: текст рисуется в задний буфер, present() сравнивает его
+    с передним и одной записью выводит только изменившиеся ячейки.
+    """
+    # Разрыв между изменениями короче перемещения курсора дешевле перепечатать
+    MAX_GAP = 4
+    _BLANK = (' ', None)
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._front = [[self._BLANK] * width for _ in range(height)]
+        self._back = [[self._BLANK] * width for _ in range(height)]
+
+    def clear(self) -> None:
+        self._back = [[self._BLANK] * self.width for _ in range(self.height)]
+
+    def invalidate(self) -> None:
+        # при следующем present() экран будет перерисован целиком
+        self._front = [[None] * self.width for _ in range(self.height)]
+
+    def put(self, x: int, y: int, char: str, color: Optional[Color]) -> None:
+        # x, y - координаты терминала, начиная с 1
+        if 1 <= x <= self.width and 1 <= y <= self.height:
+            self._back[y - 1][x - 1] = self._BLANK if char == ' ' else (char, color)
+
+    def draw_text(self, text: str, color: Color, position: Tuple[int, int], symbol: str,
+                  font: Union[str, Font, None] = None, width: Optional[int] = None) -> None:
+        font = Printer.resolve_font(font)
+        left, y = position
+        for text_line in (layout_text(text, font, width) if width else (text,)):
+            x = left
+            for char in text_line:
+                pattern = font.pattern(char)
+                for row, line in enumerate(pattern):
+                    for column, pixel in enumerate(line):
+                        self.put(x + column, y + row, symbol if pixel == '@' else ' ', color)
+                x += font.advance(char)
+            y += font.height + 1
+
+    def diff(self) -> str:
+        parts = []
+        cursor = None
+        current_color = None
+        for y, (front_row, back_row) in enumerate(zip(self._front, self._back)):
+            changed = [x for x in range(self.width) if front_row[x] != back_row[x]]
+            if not changed:
+                continue
+
+            runs = []
+            start = end = changed[0]
+            for x in changed[1:]:
+                if x - end - 1 <= self.MAX_GAP:
+                    end = x
+                else:
+                    runs.append((start, end))
+                    start = end = x
+            runs.append((start, end))
+
+            for start, end in runs:
+                if cursor != (start, y):
+                    parts.append(AnsiCodes.move_cursor(start + 1, y + 1))
+                for char, color in back_row[start:end + 1]:
+                    # пробелу цвет не важен, поэтому переключаем цвет только для символов
+                    if color is not None and color is not current_color:
+                        parts.append(color.value)
+                        current_color = color
+                    parts.append(char)
+                cursor = (end + 1, y)
+
+        if current_color is not None:
+            parts.append(Color.RESET.value)
+        return ''.join(parts)
+
+    def flip(self) -> str:
+        # разница между буферами; задний буфер становится передним
+        data = self.diff()
+        self._front = [list(row) for row in self._back]
+        return data
+
+    def present(self) -> None:
+        data = self.flip()
+        if data:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+
+
+class AsyncPrinter:
+    """
+    Асинхронная отрисовка для asyncio-сервисов. Задания ставятся в очередь,
+    растеризация и запись в терминал идут в отдельном потоке, поэтому цикл событий
+    не блокируется медленным терминалом. Более новое задание для той же области экрана
+    заменяет еще не выполненное старое. При max_pending ожидающих заданий
+    print_static() ждет освобождения места.
+    """
+
+    def __init__(self, max_pending: int = 64):
+        self.max_pending = max_pending
+        self.coalesced = 0
+        self._pending: OrderedDict = OrderedDict()
+        self._busy = False
+        self._closing = False
+        self._changed: Optional[asyncio.Condition] = None
+        self._worker: Optional[asyncio.Task] = None
+        # один поток - задания выводятся в порядке очереди
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def start(self) -> None:
+        self._changed = asyncio.Condition()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def print_static(self, text: str, color: Color, position: Tuple[int, int], symbol: str,
+                           font: Union[str, Font, None] = None, region: Optional[Hashable] = None) -> None:
+        # region - ключ области экрана, по умолчанию позиция вывода
+        key = position if region is None else region
+        job = (text, color, position, symbol, Printer.resolve_font(font))
+        async with self._changed:
+            if key not in self._pending:
+                await self._changed.wait_for(lambda: len(self._pending) < self.max_pending or key in self._pending)
+            if key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = job
+            self._changed.notify_all()
+
+    async def join(self) -> None:
+        # ожидание вывода всех поставленных заданий
+        async with self._changed:
+            await self._changed.wait_for(lambda: not self._pending and not self._busy)
+
+    async def close(self) -> None:
+        async with self._changed:
+            self._closing = True
+            self._changed.notify_all()
+        await self._worker
+        self._executor.shutdown()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._pending or self._closing)
+                if not self._pending:
+                    return
+                _, job = self._pending.popitem(last=False)
+                self._busy = True
+                self._changed.notify_all()
+            try:
+                await loop.run_in_executor(self._executor, self._render_and_write, job)
+            except Exception as e:
+                # ошибка одного задания не останавливает вывод остальных
+                print(f"Ошибка асинхронного вывода: {e}", file=sys.stderr)
+            finally:
+                async with self._changed:
+                    self._busy = False
+                    self._changed.notify_all()
+
+    @staticmethod
+    def _render_and_write(job) -> None:
+        _write_raw(Printer.render(*job))
+
+
+def _init_canvas_worker(fonts: List[Tuple[str, Optional[str], Optional[dict], int]]) -> None:
+    # шрифты открываются один раз на процесс; .pfnt отображается в память и делится между процессами
+    for name, path, glyphs, height in fonts:
+        if name not in FONTS:
+            if path is not None:
+                FONTS.load(path, name)
+            else:
+                FONTS.register(Font(name, MappingProxyType(glyphs), height))
+
+
+def _render_band(band: List[Tuple[str, Color, Tuple[int, int], str, str]],
+                 fonts: Optional[Mapping[str, Font]] = None) -> bytes:
+    # в процессах пула шрифты берутся из реестра, заполненного _init_canvas_worker
+    return b''.join(Printer.render(text, color, position, symbol,
+                                   fonts[font] if fonts is not None else FONTS.get(font))
+                    for text, color, position, symbol, font in band)
+
+
+class Canvas:
+    """
+    Большой холст из многих надписей. Надписи раскладываются по строкам в текущем процессе,
+    строки делятся на полосы, полосы растеризуются в пуле из processes процессов,
+    а готовые куски склеиваются в один кадр и выводятся одной записью.
+    processes=None - растеризация в текущем процессе.
+    """
+
+    def __init__(self, processes: Optional[int] = None, bands: Optional[int] = None):
+        self.processes = processes
+        # по умолчанию по 4 полосы на процесс, чтобы процессы не простаивали на неровных полосах
+        self.bands = bands or 4 * (processes or 1)
+        self._lines: List[Tuple[str, Color, Tuple[int, int], str, str]] = []
+        self._fonts: Dict[str, Font] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add(self, text: str, color: Color, position: Tuple[int, int], symbol: str,
+            font: Union[str, Font, None] = None, width: Optional[int] = None) -> int:
+        """Добавляет надпись, возвращает строку терминала под ней"""
+        font = Printer.resolve_font(font)
+        if font.name not in self._fonts and self._executor is not None:
+            raise RuntimeError("Новые шрифты нельзя добавлять после запуска процессов")
+        self._fonts[font.name] = font
+        x, y = position
+        for line in (layout_text(text, font, width) if width else (text,)):
+            self._lines.append((line, color, (x, y), symbol, font.name))
+            y += font.height + 1
+        return y
+
+    def clear(self) -> None:
+        self._lines.clear()
+
+    def _split(self) -> List[list]:
+        # полосы - подряд идущие строки, отсортированные сверху вниз
+        lines = sorted(self._lines, key=lambda line: (line[2][1], line[2][0]))
+        size = max(-(-len(lines) // self.bands), 1)
+        return [lines[i:i + size] for i in range(0, len(lines), size)]
+
+    def _start(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            fonts = [(font.name, font.path, None if font.path else dict(font.glyphs), font.height)
+                     for font in self._fonts.values()]
+            self._executor = ProcessPoolExecutor(max_workers=self.processes,
+                                                 initializer=_init_canvas_worker, initargs=(fonts,))
+        return self._executor
 
+    def render(self) -> bytes:
+        bands = self._split()
+        if self.processes is None:
+            return b''.join(_render_band(band, self._fonts) for band in bands)
+        return b''.join(self._start().map(_render_band, bands))
 
+    def present(self) -> None:
+        data = self.render()
+        if data:
+            _write_raw(data + Color.RESET.value.encode())
 
-with Printer(Color.RED, (0, 0), '#') as p:
-    p.print('апfg', Color.RED, (0, 0), '#')
\ No newline at end of file
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -1,9 +1,17 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from re import search
+import re
+from collections import deque
+import atexit
+import gzip
+import os
+import shutil
 import socket
+import struct
 import datetime
-from typing import List
+import threading
+import time
+from typing import Callable, List, Optional, Union
 
 
 class LogLevel(Enum):
@@ -58,9 +66,10 @@ class SimpleLogFilter(ILogFilter):
 class ReLogFilter(ILogFilter):
     def __init__(self, re_pattern: str):
         self.re_pattern = re_pattern
+        self.regex = re.compile(re_pattern)
 
     def match(self, log_level: LogLevel, text: str) -> bool:
-        match_object = search(self.re_pattern, text)
+        match_object = self.regex.search(text)
         return bool(match_object)
 
 
@@ -72,20 +81,201 @@ class LevelFilter(ILogFilter):
         return log_level >= self.min_level
 
 
+class AllSubstringsFilter(ILogFilter):
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+
+    def match(self, log_level: LogLevel, text: str) -> bool:
+        for pattern in self.patterns:
+            if pattern not in text:
+                return False
+        return True
+
+
+class FilterChain(ILogFilter):
+    # level and substring filters are merged, then all filters are ordered by cost per rejected record
+    STATIC_COST = {LevelFilter: 0, AllSubstringsFilter: 1, ReLogFilter: 2}
+
+    def __init__(self, filters: List[ILogFilter], sample_every: int = 64, reorder_every: int = 1024):
+        self.sample_every = sample_every
+        self.reorder_every = reorder_every
+        self.filters = self._merge(filters)
+        self.filters.sort(key=lambda f: self.STATIC_COST.get(type(f), 3))
+        # filter -> [sampled calls, rejections, seconds]
+        self._stats = {f: [0, 0, 0.0] for f in self.filters}
+        self._count = 0
+
+    @staticmethod
+    def _merge(filters: List[ILogFilter]) -> List[ILogFilter]:
+        levels = [f.min_level for f in filters if type(f) is LevelFilter]
+        substrings = [f.pattern for f in filters if type(f) is SimpleLogFilter]
+        merged = [f for f in filters if type(f) not in (LevelFilter, SimpleLogFilter)]
+
+        if levels:
+            merged.append(LevelFilter(max(levels)))
+        if substrings:
+            merged.append(AllSubstringsFilter(substrings))
+        # regexes stay separate precompiled filters: a combined lookahead pattern defeats the literal
+        # prefix search of re and hides the cost and selectivity of each pattern from _reorder
+        return merged
+
+    def level_allowed(self, log_level: LogLevel) -> bool:
+        for log_filter in self.filters:
+            if isinstance(log_filter, LevelFilter) and not log_filter.match(log_level, ''):
+                return False
+        return True
+
+    def match(self, log_level: LogLevel, text: str) -> bool:
+        self._count += 1
+        if self._count % self.sample_every == 0:
+            return self._match_sampled(log_level, text)
+        for log_filter in self.filters:
+            if not log_filter.match(log_level, text):
+                return False
+        return True
+
+    def _match_sampled(self, log_level: LogLevel, text: str) -> bool:
+        # on sampled records every filter runs, so selectivity is measured without order bias
+        result = True
+        for log_filter in self.filters:
+            start = time.perf_counter()
+            matched = log_filter.match(log_level, text)
+            stats = self._stats[log_filter]
+            stats[0] += 1
+            stats[1] += not matched
+            stats[2] += time.perf_counter() - start
+            result = result and matched
+        if self._count % self.reorder_every < self.sample_every:
+            self._reorder()
+        return result
+
+    def _reorder(self) -> None:
+        def cost_per_rejection(log_filter):
+            calls, rejections, seconds = self._stats[log_filter]
+            if not calls:
+                return float('inf')
+            return seconds / calls / max(rejections / calls, 1e-6)
+
+        self.filters = sorted(self.filters, key=cost_per_rejection)
+
+
 # endregion
 
 
 class FileHandler(ILogHandler):
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, buffer_size: int = 64 * 1024, flush_interval: Optional[float] = 1.0,
+                 flush_level: LogLevel = LogLevel.ERROR, max_bytes: Optional[int] = None,
+                 rotate_interval: Optional[float] = None, backup_count: int = 5, compress: bool = False):
         self.file_path = file_path
+        # buffered records are written when any threshold is reached
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        # rotation: file_path -> file_path.1 -> ... -> file_path.<backup_count>
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self._file = None
+        self._opened_at = 0.0
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._timer: Optional[threading.Timer] = None
+        self._compressor: Optional[threading.Thread] = None
+        self._lock = threading.RLock()
+        atexit.register(self.close)
 
     def handle(self, log_level: LogLevel, text: str) -> None:
         try:
-            with open(self.file_path, 'a', encoding='utf-8') as file:
-                file.write(text + '\n')
+            with self._lock:
+                line = text + '\n'
+                self._buffer.append(line)
+                self._buffered += len(line)
+                if self._buffered >= self.buffer_size or log_level >= self.flush_level:
+                    self._flush()
+                elif self._timer is None and self.flush_interval is not None:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        except Exception as e:
+            print(f"Writing to file error: {e}")
+
+    def flush(self) -> None:
+        try:
+            with self._lock:
+                self._flush()
         except Exception as e:
             print(f"Writing to file error: {e}")
 
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        data = ''.join(self._buffer).encode('utf-8')
+        if self._file is None:
+            self._open()
+        if self._should_rotate(len(data)):
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        # records leave the buffer only after they are written, a failed write is retried on the next flush
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _open(self) -> None:
+        self._file = open(self.file_path, 'ab')
+        self._opened_at = time.time()
+
+    def _should_rotate(self, size: int) -> bool:
+        if self.max_bytes is not None and 0 < self._file.tell() and self._file.tell() + size > self.max_bytes:
+            return True
+        return self.rotate_interval is not None and time.time() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        # the previous backup must be compressed before it is renamed
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor = None
+
+        if self.backup_count > 0:
+            suffix = '.gz' if self.compress else ''
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f'{self.file_path}.{i}{suffix}'
+                if os.path.exists(source):
+                    os.replace(source, f'{self.file_path}.{i + 1}{suffix}')
+            backup = f'{self.file_path}.1'
+            os.replace(self.file_path, backup)
+            if self.compress:
+                self._compressor = threading.Thread(target=self._compress, args=(backup,), daemon=True)
+                self._compressor.start()
+        else:
+            os.remove(self.file_path)
+        self._open()
+
+    @staticmethod
+    def _compress(path: str) -> None:
+        try:
+            with open(path, 'rb') as source, gzip.open(path + '.gz', 'wb') as target:
+                shutil.copyfileobj(source, target)
+            os.remove(path)
+        except Exception as e:
+            print(f"Log compression error: {e}")
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor = None
+        atexit.unregister(self.close)
+
 
 class ConsoleHandler(ILogHandler):
     def __init__(self):
@@ -96,20 +286,117 @@ class ConsoleHandler(ILogHandler):
 
 
 class SocketHandler(ILogHandler):
-    def __init__(self, host, port):
+    # every record is sent as a frame: length (4 bytes, network order) + utf-8 text;
+    # UDP packs several frames into one datagram, TCP streams frames over one connection
+    FRAME = struct.Struct('!I')
+    MAX_DATAGRAM = 1400
+
+    def __init__(self, host, port, protocol: str = 'udp', flush_interval: float = 0.05,
+                 max_queue: int = 10000, max_backoff: float = 30.0):
+        if protocol not in ('udp', 'tcp'):
+            raise ValueError(f"Unknown protocol: {protocol}")
         self.host = host
         self.port = port
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.protocol = protocol
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.max_backoff = max_backoff
+        self.dropped = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM) if protocol == 'udp' else None
+        self._queue = deque()
+        self._queued_bytes = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name='SocketHandler', daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
 
     def handle(self, log_level: LogLevel, text: str) -> None:
-        try:
-            data = text.encode('utf-8')
-            self.sock.sendto(data, (self.host, self.port))
-        except Exception as e:
-            print(f'Socket error: {e}')
-
-    def __del__(self):
-        self.sock.close()
+        # never blocks: the record is queued, the worker thread sends it
+        data = text.encode('utf-8')
+        frame = self.FRAME.pack(len(data)) + data
+        with self._condition:
+            if self._closed:
+                self.dropped += 1
+                return
+            if len(self._queue) >= self.max_queue:
+                self._queued_bytes -= len(self._queue.popleft())
+                self.dropped += 1
+            self._queue.append(frame)
+            self._queued_bytes += len(frame)
+            self._condition.notify()
+
+    def _run(self) -> None:
+        backoff = 0.1
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    break
+                # a short pause lets more records join the batch
+                self._condition.wait_for(lambda: self._closed or self._queued_bytes >= self.MAX_DATAGRAM,
+                                         self.flush_interval)
+                frames = list(self._queue)
+                self._queue.clear()
+                self._queued_bytes = 0
+
+            if self.protocol == 'udp':
+                self._send_udp(frames)
+                continue
+
+            try:
+                self._send_tcp(frames)
+                backoff = 0.1
+            except OSError as e:
+                print(f'Socket error: {e}')
+                self._disconnect()
+                with self._condition:
+                    if self._closed:
+                        self.dropped += len(frames)
+                        continue
+                    # unsent records go back to the head of the queue until reconnect succeeds
+                    self._queue.extendleft(reversed(frames))
+                    self._queued_bytes += sum(map(len, frames))
+                    self._condition.wait_for(lambda: self._closed, backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+        self._disconnect()
+
+    def _send_udp(self, frames: List[bytes]) -> None:
+        # (datagram, number of frames in it); a frame larger than MAX_DATAGRAM goes alone
+        datagrams = []
+        datagram, count = b'', 0
+        for frame in frames:
+            if datagram and len(datagram) + len(frame) > self.MAX_DATAGRAM:
+                datagrams.append((datagram, count))
+                datagram, count = b'', 0
+            datagram += frame
+            count += 1
+        datagrams.append((datagram, count))
+
+        # a failed datagram (e.g. EMSGSIZE for an oversized record) loses only its own frames
+        for datagram, count in datagrams:
+            try:
+                self.sock.sendto(datagram, (self.host, self.port))
+            except OSError as e:
+                print(f'Socket error: {e}')
+                self.dropped += count
+
+    def _send_tcp(self, frames: List[bytes]) -> None:
+        if self.sock is None:
+            self.sock = socket.create_connection((self.host, self.port), timeout=5)
+        self.sock.sendall(b''.join(frames))
+
+    def _disconnect(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+        atexit.unregister(self.close)
 
 
 class SyslogHandler(ILogHandler):
@@ -140,9 +427,21 @@ class FtpHandler(ILogHandler):
 class Formatter(ILogFormatter):
     def __init__(self, datetime_format):
         self.datetime_format = datetime_format
+        # (second, formatted time): strftime runs once per second, not once per record
+        self._cached_time = (None, '')
 
     def format(self, log_level: LogLevel, text: str) -> str:
-        return f'[{log_level}] [{datetime.datetime.now().strftime(self.datetime_format)}] {text}'
+        return f'[{log_level}] [{self._format_time()}] {text}'
+
+    def _format_time(self) -> str:
+        if '%f' in self.datetime_format:
+            return datetime.datetime.now().strftime(self.datetime_format)
+        second = int(time.time())
+        cached_second, formatted = self._cached_time
+        if cached_second != second:
+            formatted = datetime.datetime.fromtimestamp(second).strftime(self.datetime_format)
+            self._cached_time = (second, formatted)
+        return formatted
 
 
 # endregion
@@ -156,25 +455,135 @@ class Logger:
         self.handlers = handlers
         self.formatters = formatters
 
-    def log(self, log_level: LogLevel, text: str) -> None:
+    def log(self, log_level: LogLevel, text: Union[str, Callable[[], str]], *args) -> None:
+        # text may be a template for str.format with args, or a callable returning the text;
+        # it is rendered only if the record passes the level filters
+        processed_text = self._prepare(log_level, text, args)
+        if processed_text is not None:
+            self._dispatch(log_level, processed_text)
+
+    def _level_allowed(self, log_level: LogLevel) -> bool:
+        for log_filter in self.filters:
+            if isinstance(log_filter, LevelFilter) and not log_filter.match(log_level, ''):
+                return False
+            if isinstance(log_filter, FilterChain) and not log_filter.level_allowed(log_level):
+                return False
+        return True
+
+    def _prepare(self, log_level: LogLevel, text: Union[str, Callable[[], str]], args: tuple = ()) -> Optional[str]:
+        if not self.handlers or not self._level_allowed(log_level):
+            return None
+        if callable(text):
+            text = text()
+        elif args:
+            text = text.format(*args)
+
         for log_filter in self.filters:
             if not log_filter.match(log_level, text):
-                return
+                return None
 
         processed_text = text
         for formatter in self.formatters:
             processed_text = formatter.format(log_level, processed_text)
+        return processed_text
 
+    def _dispatch(self, log_level: LogLevel, text: str) -> None:
         for handler in self.handlers:
-            handler.handle(log_level, processed_text)
+            handler.handle(log_level, text)
+
+    def log_info(self, text: Union[str, Callable[[], str]], *args) -> None:
+        self.log(LogLevel.INFO, text, *args)
+
+    def log_warn(self, text: Union[str, Callable[[], str]], *args) -> None:
+        self.log(LogLevel.WARN, text, *args)
+
+    def log_error(self, text: Union[str, Callable[[], str]], *args) -> None:
+        self.log(LogLevel.ERROR, text, *args)
+
+
+class OverflowPolicy(Enum):
+    BLOCK = 1
+    DROP_OLDEST = 2
+    DROP_NEW = 3
+
+
+class AsyncLogger(Logger):
+    def __init__(self, filters: List[ILogFilter], handlers: List[ILogHandler], formatters: List[ILogFormatter],
+                 max_queue: int = 10000, overflow: OverflowPolicy = OverflowPolicy.BLOCK):
+        super().__init__(filters, handlers, formatters)
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.dropped = 0
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._in_progress = 0
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name='AsyncLogger', daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def log(self, log_level: LogLevel, text: Union[str, Callable[[], str]], *args) -> None:
+        # filters and formatters run on the caller's thread, handlers run on the worker
+        processed_text = self._prepare(log_level, text, args)
+        if processed_text is None:
+            return
+
+        with self._condition:
+            if not self._closed and len(self._queue) >= self.max_queue:
+                if self.overflow is OverflowPolicy.BLOCK:
+                    self._condition.wait_for(lambda: len(self._queue) < self.max_queue or self._closed)
+                elif self.overflow is OverflowPolicy.DROP_NEW:
+                    self.dropped += 1
+                    return
+                else:
+                    self._queue.popleft()
+                    self.dropped += 1
+            if not self._closed:
+                self._queue.append((log_level, processed_text))
+                self._condition.notify_all()
+                return
 
-    def log_info(self, text: str) -> None:
-        self.log(LogLevel.INFO, text)
+        # after close() records are written synchronously instead of being lost
+        self._dispatch(log_level, processed_text)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+                self._in_progress = len(batch)
+                self._condition.notify_all()
+
+            for log_level, text in batch:
+                try:
+                    self._dispatch(log_level, text)
+                except Exception as e:
+                    print(f'Async logging error: {e}')
+
+            with self._condition:
+                self._in_progress = 0
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._in_progress, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+        atexit.unregister(self.close)
 
-    def log_warn(self, text: str) -> None:
-        self.log(LogLevel.WARN, text)
+    def __enter__(self):
+        return self
 
-    def log_error(self, text: str) -> None:
-        self.log(LogLevel.ERROR, text)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 # endregion
@@ -0,0 +1,78 @@
+import socket
+import threading
+from typing import List, Optional
+
+from log_classes import SocketHandler
+
+
+class LogListener:
+    # local stand-in for a log collector: receives SocketHandler frames over UDP or TCP
+    def __init__(self, protocol: str = 'udp', host: str = '127.0.0.1', port: int = 0):
+        self.protocol = protocol
+        self.records: List[str] = []
+        self.datagrams = 0
+        self.connections = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        kind = socket.SOCK_DGRAM if protocol == 'udp' else socket.SOCK_STREAM
+        self.sock = socket.socket(socket.AF_INET, kind)
+        self.sock.bind((host, port))
+        self.host, self.port = self.sock.getsockname()
+        if protocol == 'tcp':
+            self.sock.listen()
+        self._thread = threading.Thread(target=self._serve_udp if protocol == 'udp' else self._serve_tcp,
+                                        daemon=True)
+        self._thread.start()
+
+    def _add(self, data: bytes) -> bytes:
+        # whole frames are stored, an incomplete tail is returned to wait for more bytes
+        header = SocketHandler.FRAME.size
+        records = []
+        while len(data) >= header:
+            size, = SocketHandler.FRAME.unpack_from(data)
+            if len(data) < header + size:
+                break
+            records.append(data[header:header + size].decode('utf-8'))
+            data = data[header + size:]
+        with self._condition:
+            self.records.extend(records)
+            self._condition.notify_all()
+        return data
+
+    def _serve_udp(self) -> None:
+        while not self._closed:
+            try:
+                data, _ = self.sock.recvfrom(65535)
+            except OSError:
+                return
+            self.datagrams += 1
+            self._add(data)
+
+    def _serve_tcp(self) -> None:
+        while not self._closed:
+            try:
+                connection, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._read_connection, args=(connection,), daemon=True).start()
+
+    def _read_connection(self, connection: socket.socket) -> None:
+        pending = b''
+        with connection:
+            while True:
+                try:
+                    data = connection.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                pending = self._add(pending + data)
+
+    def wait_for(self, count: int, timeout: Optional[float] = 5.0) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self.records) >= count, timeout)
+
+    def close(self) -> None:
+        self._closed = True
+        self.sock.close()
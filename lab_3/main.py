@@ -3,14 +3,20 @@ from log_classes import (
     SimpleLogFilter,
     ReLogFilter,
     LevelFilter,
+    FilterChain,
     ConsoleHandler,
     SocketHandler,
     FileHandler,
     SyslogHandler,
     FtpHandler,
     Formatter,
-    Logger
+    Logger,
+    AsyncLogger,
+    OverflowPolicy
 )
+from log_listener import LogListener
+import os
+import time
 
 print("===== DEMO FILTERS =====")
 
@@ -33,6 +39,12 @@ print('\n>>> level = WARN')
 print(f'info text: {level_filter.match(LogLevel.INFO, text1)}')
 print(f'warn text: {level_filter.match(LogLevel.ERROR, text2)}')
 
+print('\n>>> filter chain: level first, then substrings, then regexes')
+filter_chain = FilterChain([re_filter, ReLogFilter(r"error"), simple_filter, level_filter])
+print([type(f).__name__ for f in filter_chain.filters])
+print(f'"{text3}" warn: {filter_chain.match(LogLevel.WARN, text3 + " problem")}')
+print(f'"{text3}" info: {filter_chain.match(LogLevel.INFO, text3 + " problem")}')
+
 
 print("\n===== DEMO HANDLERS =====")
 
@@ -40,15 +52,39 @@ print('\n>>> console_handler')
 console_handler = ConsoleHandler()
 console_handler.handle(LogLevel.INFO, "This message wrote in console")
 
-file_handler = FileHandler("demo_log.txt")
+print('\n>>> file_handler (file stays open, INFO/WARN records wait in memory up to flush_interval)')
+file_handler = FileHandler("demo_log.txt", flush_interval=0.2)
 file_handler.handle(LogLevel.INFO, "text1")
+print(f"in file right after handle: {os.path.exists('demo_log.txt')}")
+time.sleep(0.3)
+with open("demo_log.txt", encoding='utf-8') as log_file:
+    print(f"in file after flush_interval: {'text1' in log_file.read()}")
+file_handler.handle(LogLevel.ERROR, "error text")
+with open("demo_log.txt", encoding='utf-8') as log_file:
+    print(f"ERROR record written at once: {'error text' in log_file.read()}")
+
+print('\n>>> file_handler with rotation by size and compression')
+rotating_handler = FileHandler("rotating_log.txt", buffer_size=0, max_bytes=100, backup_count=2, compress=True)
+for i in range(10):
+    rotating_handler.handle(LogLevel.INFO, f"rotating record {i}")
+rotating_handler.close()
+print(sorted(name for name in os.listdir('.') if name.startswith("rotating_log.txt")))
 
 print('\n>>> syslog_handler')
 syslog_handler = SyslogHandler("Pinterest")
 syslog_handler.handle(LogLevel.INFO, "Syslog simulation")
 
-socket_handler = SocketHandler('127.0.0.1', 0000)
-socket_handler.handle(LogLevel.INFO, "Socket simulation")
+print('\n>>> socket_handler (records are batched and sent from a background thread)')
+for protocol in ('udp', 'tcp'):
+    listener = LogListener(protocol)
+    socket_handler = SocketHandler(listener.host, listener.port, protocol)
+    for i in range(100):
+        socket_handler.handle(LogLevel.INFO, f"Socket simulation {i}")
+    socket_handler.close()
+    listener.wait_for(100)
+    print(f"{protocol}: received {len(listener.records)} records, "
+          f"datagrams: {listener.datagrams}, connections: {listener.connections}")
+    listener.close()
 
 print('\n>>> ftp_handler')
 ftp_handler = FtpHandler("ftp.reddit.com", "Kreek")
@@ -82,3 +118,34 @@ logger = Logger(filters, handlers, formatters)
 logger.log_info(text1)
 logger.log_warn(text2)
 logger.log_error("fatality")
+
+print('\n>>> lazy messages: text is built only for records that pass the level filter')
+warn_logger = Logger([LevelFilter(LogLevel.WARN)], [ConsoleHandler()], formatters)
+warn_logger.log_info(lambda: print("never built") or "expensive info")
+warn_logger.log_warn("disk {} is {}% full", "/dev/sda1", 93)
+warn_logger.log_error(lambda: f"expensive report: {sum(range(10 ** 6))}")
+
+
+print("\n===== DEMO ASYNC LOGGER =====")
+
+
+class SlowHandler(ConsoleHandler):
+    def handle(self, log_level, text):
+        time.sleep(0.01)
+        super().handle(log_level, text)
+
+
+print('\n>>> log() returns at once, slow handler works in background')
+with AsyncLogger(filters, [SlowHandler()], formatters) as async_logger:
+    start = time.perf_counter()
+    for i in range(5):
+        async_logger.log_info(f"async message {i}")
+    print(f"5 records queued in {(time.perf_counter() - start) * 1000:.2f} ms")
+    async_logger.flush()
+
+print('\n>>> queue of 3 records, policy DROP_OLDEST')
+with AsyncLogger(filters, [SlowHandler()], formatters, max_queue=3,
+                 overflow=OverflowPolicy.DROP_OLDEST) as async_logger:
+    for i in range(10):
+        async_logger.log_warn(f"burst message {i}")
+print(f"dropped: {async_logger.dropped}")